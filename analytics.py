@@ -23,7 +23,7 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 import streamlit as st
 
@@ -46,21 +46,40 @@ def _ensure_state() -> None:
     st.session_state.setdefault("_analytics_once_keys", set())
 
 
-def _append_to_file(event: Dict[str, Any]) -> None:
+def _append_to_file(*events: Dict[str, Any]) -> None:
     """
-    Best-effort append of a single event to the JSONL log file.
+    Best-effort append of one or more events to the JSONL log file
+    (a single open + write, however many events).
 
     If writing fails (for example, on ephemeral file systems),
     the exception is swallowed so the UI never breaks because of logging.
     """
     try:
         with open(ANALYTICS_LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+            f.write(
+                "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events)
+            )
     except Exception:
         # File logging is optional and may fail on some deployments.
         pass
 
 
+def _make_payload(
+    event: str, page: str, props: Optional[Dict[str, Any]], now: str
+) -> Dict[str, Any]:
+    """Build the stored event record."""
+    # We use a single timestamp and store it under two keys:
+    # - "timestamp": the name expected by the Statistics dashboard
+    # - "ts": kept for backwards compatibility with older files
+    return {
+        "timestamp": now,
+        "ts": now,
+        "event": str(event),
+        "page": str(page),
+        "props": props or {},
+    }
+
+
 def track_event(event: str, page: str, props: Optional[Dict[str, Any]] = None) -> None:
     """
     Record a single analytics event.
@@ -78,26 +97,40 @@ def track_event(event: str, page: str, props: Optional[Dict[str, Any]] = None) -
         - selected object IDs
         - export format, etc.
     """
+    track_events([(event, page, props)])
+
+
+def track_events(
+    events: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]],
+) -> None:
+    """
+    Record several `(event, page, props)` events at once.
+
+    Same records as calling track_event for each, but with one timestamp
+    and a single write to the JSONL file.
+    """
     _ensure_state()
 
-    # We use a single timestamp and store it under two keys:
-    # - "timestamp": the name expected by the Statistics dashboard
-    # - "ts": kept for backwards compatibility with older files
     now = _utc_now_iso()
+    payloads = [_make_payload(event, page, props, now) for event, page, props in events]
+    if not payloads:
+        return
 
-    payload: Dict[str, Any] = {
-        "timestamp": now,
-        "ts": now,
-        "event": str(event),
-        "page": str(page),
-        "props": props or {},
-    }
-
-    # 1) Keep it in memory for this session
-    st.session_state["_analytics_events"].append(payload)
+    # 1) Keep them in memory for this session
+    st.session_state["_analytics_events"].extend(payloads)
 
     # 2) Best-effort write to the JSONL file
-    _append_to_file(payload)
+    _append_to_file(*payloads)
+
+
+def was_tracked(once_key: str) -> bool:
+    """
+    Return True if `once_key` was already recorded by track_event_once
+    in this session.
+
+    Lets call sites skip building the event props on every rerun.
+    """
+    return once_key in st.session_state.get("_analytics_once_keys", ())
 
 
 def track_event_once(
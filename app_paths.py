@@ -2,7 +2,7 @@
 app_paths.py — central paths for local persistence and assets.
 
 This app uses local JSON files for:
-- favorites (global selection)
+- favorites (global selection: snapshot + append-only journal)
 - notes
 - pdf metadata configuration
 - analytics events (local only, no external tracking)
@@ -29,6 +29,7 @@ ANALYTICS_DIR.mkdir(parents=True, exist_ok=True)
 
 # Core files (local persistence)
 FAV_FILE = DATA_DIR / "favorites.json"
+FAV_LOG_FILE = DATA_DIR / "favorites.log.jsonl"  # journal of single toggles
 NOTES_FILE = DATA_DIR / "notes.json"
 PDF_META_FILE = DATA_DIR / "pdf_meta.json"
 
@@ -0,0 +1,150 @@
+"""
+favorites_store.py — favorites persistence: JSON snapshot + append-only journal.
+
+`favorites.json` (FAV_FILE) is the snapshot: a dict objectNumber -> artwork.
+Selection changes (checkbox toggles, page-wide add/remove) are appended to
+`favorites.log.jsonl` (FAV_LOG_FILE) as one small line per artwork instead
+of rewriting the whole snapshot.
+
+Each journal line records the snapshot mtime it applies on top of ("base").
+Lines whose base does not match the current snapshot are ignored, so any code
+path that rewrites favorites.json directly (e.g. the My Selection page)
+implicitly supersedes older journal entries without having to know about them.
+
+Readers that want the full, current selection use `load_favorites_from_disk()`.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import orjson
+
+from app_paths import FAV_FILE, FAV_LOG_FILE
+
+# Fold the journal into the snapshot once it grows past this size
+LOG_COMPACT_BYTES = 64 * 1024
+
+
+def snapshot_mtime_ns() -> int:
+    """mtime of favorites.json in ns (0 when the file does not exist)."""
+    try:
+        return FAV_FILE.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def read_snapshot() -> Dict[str, Any]:
+    """Read favorites.json (returns dict or {})."""
+    try:
+        data = orjson.loads(FAV_FILE.read_bytes())
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def replay_journal(favorites: Dict[str, Any], base: int) -> Dict[str, Any]:
+    """Apply the journal entries recorded on top of snapshot `base` (in place)."""
+    try:
+        raw = FAV_LOG_FILE.read_bytes()
+    except OSError:
+        return favorites
+
+    for line in raw.splitlines():
+        try:
+            entry = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # Torn last line after a crash: skip it
+            continue
+        if not isinstance(entry, dict) or entry.get("base") != base:
+            continue
+        obj_id = entry.get("id")
+        if not obj_id:
+            continue
+        if entry.get("op") == "add":
+            favorites[obj_id] = entry.get("art") or {}
+        elif entry.get("op") == "del":
+            favorites.pop(obj_id, None)
+    return favorites
+
+
+def load_favorites_from_disk() -> Dict[str, Any]:
+    """Current favorites: snapshot plus the journal entries that apply to it."""
+    base = snapshot_mtime_ns()
+    favorites = read_snapshot() if base else {}
+    return replay_journal(favorites, base)
+
+
+def append_favorite_ops(
+    ops: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]],
+) -> bool:
+    """
+    Append "add"/"del" entries `(op, object_number, art)` to the journal in
+    a single write.
+
+    Returns True when the caller should compact (write a full snapshot with
+    `write_snapshot`), i.e. when the journal has grown past LOG_COMPACT_BYTES
+    or could not be written at all.
+    """
+    base = snapshot_mtime_ns()
+    lines = []
+    try:
+        for op, object_number, art in ops:
+            entry: Dict[str, Any] = {"base": base, "op": op, "id": object_number}
+            if op == "add":
+                entry["art"] = art or {}
+            lines.append(orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS) + b"\n")
+        if not lines:
+            return False
+        with open(FAV_LOG_FILE, "ab") as f:
+            f.write(b"".join(lines))
+            size = f.tell()
+    except (OSError, TypeError):
+        return True
+    return size > LOG_COMPACT_BYTES
+
+
+def append_favorite_op(
+    op: str, object_number: str, art: Optional[Dict[str, Any]] = None
+) -> bool:
+    """Append one "add"/"del" entry to the journal (see append_favorite_ops)."""
+    return append_favorite_ops([(op, object_number, art)])
+
+
+def write_snapshot(favorites: Dict[str, Any]) -> None:
+    """
+    Write the full favorites dict atomically and drop the journal.
+
+    Writes to a uniquely named temp file in the same directory and swaps it
+    in with os.replace, so a crash mid-write never leaves a truncated
+    favorites.json behind, and concurrent writers (two sessions flushing at
+    once) never share a temp file.
+    """
+    tmp = None
+    try:
+        data = orjson.dumps(
+            favorites,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+        fd, tmp = tempfile.mkstemp(
+            dir=FAV_FILE.parent, prefix=FAV_FILE.name + ".", suffix=".tmp"
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, FAV_FILE)
+    except (OSError, TypeError):
+        # Do not break UI if saving fails (IO error or unserializable value);
+        # keep the journal so no toggle is lost
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+        return
+
+    try:
+        FAV_LOG_FILE.unlink(missing_ok=True)
+    except OSError:
+        pass
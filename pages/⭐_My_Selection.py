@@ -13,22 +13,36 @@ Features:
 
 from __future__ import annotations
 
-from ui_theme import inject_global_css, show_global_footer, show_page_intro
+from ui_theme import (
+    inject_global_css,
+    minify_css,
+    show_global_footer,
+    show_page_intro,
+)
 
 import csv
 import io
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from html import escape
 from textwrap import wrap
 from typing import Any, Dict, List, Tuple
 
+import orjson
 import requests
 import streamlit as st
 
-from app_paths import FAV_FILE, NOTES_FILE, PDF_META_FILE
+from app_paths import NOTES_FILE, PDF_META_FILE
+from favorites_store import (
+    append_favorite_op,
+    load_favorites_from_disk,
+    write_snapshot,
+)
 from analytics import track_event, track_event_once
 from rijks_api import (
     get_best_image_url,
+    get_thumbnail_url,
     fetch_metadata_by_objectnumber,
     RijksAPIError,
     extract_year,
@@ -36,6 +50,9 @@ from rijks_api import (
 
 DEV_MODE = bool(st.secrets.get("DEV_MODE", False))
 
+# Concurrent downloads while building the PDF (thumbnails + "About" texts)
+PDF_FETCH_WORKERS = 8
+
 # ============================================================
 # Optional PDF dependency (ReportLab)
 # ============================================================
@@ -54,9 +71,10 @@ except Exception:
 # ============================================================
 
 
-def inject_page_css() -> None:
-    """CSS specific to the My Selection page (cards, badges, export panel)."""
-    st.markdown(
+@st.cache_resource(show_spinner=False)
+def _page_css() -> str:
+    """CSS specific to the My Selection page (cards, badges, export panel), minified once."""
+    return minify_css(
         """
         <style>
         .rijks-summary-pill {
@@ -160,15 +178,15 @@ def inject_page_css() -> None:
             border-color: #444444;
         }
         </style>
-        """,
-        unsafe_allow_html=True,
+        """
     )
 
 
 st.set_page_config(page_title="My Selection", page_icon="⭐", layout="wide")
 
-inject_global_css()  # base theme for the entire app
-inject_page_css()  # fine-tuned adjustments for My Selection
+# Base theme for the entire app + fine-tuned adjustments for My Selection,
+# sent as one element
+inject_global_css(_page_css())
 
 
 # ============================================================
@@ -178,8 +196,8 @@ inject_page_css()  # fine-tuned adjustments for My Selection
 
 def _safe_read_json(path) -> dict:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
         return data if isinstance(data, dict) else {}
     except Exception:
         return {}
@@ -187,10 +205,8 @@ def _safe_read_json(path) -> dict:
 
 def load_favorites() -> Dict[str, Any]:
     if "favorites" not in st.session_state:
-        if FAV_FILE.exists():
-            st.session_state["favorites"] = _safe_read_json(FAV_FILE)
-        else:
-            st.session_state["favorites"] = {}
+        # Snapshot + journal of single toggles made on the Explorer page
+        st.session_state["favorites"] = load_favorites_from_disk()
     fav = st.session_state["favorites"]
     return fav if isinstance(fav, dict) else {}
 
@@ -206,12 +222,32 @@ def load_notes() -> Dict[str, str]:
 
 
 def save_favorites(fav: Dict[str, Any]) -> None:
+    """Store favorites and write the full snapshot once, at the end of the run."""
     st.session_state["favorites"] = fav
-    try:
-        with open(FAV_FILE, "w", encoding="utf-8") as f:
-            json.dump(fav, f, ensure_ascii=False, indent=2)
-    except Exception:
-        pass
+    mark_favorites_dirty()
+
+
+def mark_favorites_dirty() -> None:
+    """Request a snapshot write at the end of the current run."""
+    st.session_state["favorites_dirty"] = True
+
+
+def flush_favorites() -> None:
+    """Write the snapshot once if this run (or an interrupted one) asked for it."""
+    if st.session_state.pop("favorites_dirty", False):
+        write_snapshot(st.session_state.get("favorites") or {})
+
+
+def save_favorite_change(
+    fav: Dict[str, Any], op: str, obj_num: str, art: Dict[str, Any] | None = None
+) -> None:
+    """
+    Persist a single-artwork change ("add" = insert/update, "del" = remove)
+    as one journal line; the full snapshot is only rewritten to compact.
+    """
+    st.session_state["favorites"] = fav
+    if append_favorite_op(op, obj_num, art):
+        mark_favorites_dirty()
 
 
 def save_notes(notes: Dict[str, str]) -> None:
@@ -228,6 +264,23 @@ def save_notes(notes: Dict[str, str]) -> None:
 # ============================================================
 
 
+# objectNumber -> parsed year. Kept beside the favorites (not on the art
+# dicts, which are persisted); the page script re-runs, so this is per run.
+_YEAR_MEMO: Dict[str, int | None] = {}
+
+
+def art_year(art: Dict[str, Any]) -> int | None:
+    """Year of an artwork, parsed from `dating` once per run."""
+    obj_num = art.get("objectNumber")
+    if obj_num in _YEAR_MEMO:
+        return _YEAR_MEMO[obj_num]
+    dating = art.get("dating") or {}
+    year = extract_year(dating) if isinstance(dating, dict) else None
+    if obj_num:
+        _YEAR_MEMO[obj_num] = year
+    return year
+
+
 def compute_selection_stats(favorites: Dict[str, Any]) -> Dict[str, Any]:
     years: List[int] = []
     artists: set[str] = set()
@@ -240,8 +293,7 @@ def compute_selection_stats(favorites: Dict[str, Any]) -> Dict[str, Any]:
         maker = art.get("principalOrFirstMaker")
         if isinstance(maker, str) and maker.strip():
             artists.add(maker.strip())
-        dating = art.get("dating") or {}
-        year = extract_year(dating) if isinstance(dating, dict) else None
+        year = art_year(art)
         if isinstance(year, int):
             years.append(year)
 
@@ -275,8 +327,8 @@ def load_pdf_meta() -> Dict[str, Any]:
 
     try:
         if PDF_META_FILE.exists():
-            with open(PDF_META_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(PDF_META_FILE, "rb") as f:
+                data = orjson.loads(f.read())
             if isinstance(data, dict):
                 base.update(data)
     except Exception:
@@ -291,50 +343,112 @@ def load_pdf_meta() -> Dict[str, Any]:
 # ============================================================
 
 
-@st.cache_data(show_spinner=False)
+# objectNumber -> best image URL, per run (like _YEAR_MEMO)
+_IMG_URL_MEMO: Dict[str, str | None] = {}
+
+
 def cached_best_image_url(art: Dict[str, Any]) -> str | None:
-    """Small cache wrapper around get_best_image_url for faster gallery rendering."""
-    return get_best_image_url(art)
+    """
+    Best image URL of an artwork, resolved once per run.
 
-def attribution_badge_html(art: Dict[str, Any]) -> str:
-    """Return HTML badge for attribution label (direct / workshop / circle / etc.)."""
-    tag = (art.get("_attribution") or "unknown").lower()
-    label_map = {
-        "direct": "✅ Direct",
-        "attributed": "🟡 Attributed",
-        "workshop": "🟠 Workshop",
-        "circle": "🔵 Circle/School",
-        "after": "🟣 After",
-        "unknown": "⚪ Unknown",
-    }
-    label = label_map.get(tag, "⚪ Unknown")
-    return f'<span class="rijks-badge">{label}</span>'
+    Memoized by objectNumber rather than with st.cache_data, which would hash
+    the whole artwork dict on every call just to find the entry.
+    """
+    obj_num = art.get("objectNumber")
+    if obj_num in _IMG_URL_MEMO:
+        return _IMG_URL_MEMO[obj_num]
+    url = get_best_image_url(art)
+    if obj_num:
+        _IMG_URL_MEMO[obj_num] = url
+    return url
+
+
+def _card_html(
+    card_classes: str,
+    img_html: str,
+    title: str,
+    maker: str,
+    badge_row: str,
+    meta_lines: List[str],
+    web_link: str | None,
+) -> str:
+    """Static part of a gallery card (image, title, badges, metadata) as one HTML string."""
+    parts = [f'<div class="{card_classes}">', img_html]
+    parts.append(f'<div class="rijks-card-title">{escape(title)}</div>')
+    parts.append(f'<div class="rijks-card-caption">{escape(str(maker))}</div>')
+    parts.append(badge_row)
+    for line in meta_lines:
+        parts.append(f'<div class="rijks-card-caption">{escape(line)}</div>')
+    if web_link:
+        parts.append(
+            f'<a href="{escape(web_link)}" target="_blank">View on Rijksmuseum website</a>'
+        )
+    parts.append("</div>")
+    return "".join(parts)
+
+
+# Card HTML fragments, built once at import (not per card / rerun)
+_ATTR_BADGE_HTML: Dict[str, str] = {
+    "direct": '<span class="rijks-badge">✅ Direct</span>',
+    "attributed": '<span class="rijks-badge">🟡 Attributed</span>',
+    "workshop": '<span class="rijks-badge">🟠 Workshop</span>',
+    "circle": '<span class="rijks-badge">🔵 Circle/School</span>',
+    "after": '<span class="rijks-badge">🟣 After</span>',
+    "unknown": '<span class="rijks-badge">⚪ Unknown</span>',
+}
+
+_KIND_BADGE_HTML: Dict[str, str] = {
+    "original": '<span class="rijks-badge rijks-badge-secondary">🖼️ Original work</span>',
+    "reproduction": '<span class="rijks-badge rijks-badge-secondary">🎞️ Reproduction</span>',
+    "photograph": '<span class="rijks-badge rijks-badge-secondary">📷 Photograph</span>',
+}
+
+_IMG_BADGE_HTML: Dict[str, str] = {
+    "copyright": '<span class="rijks-badge rijks-badge-secondary">🔒 Copyright</span>',
+    "page_missing": '<span class="rijks-badge rijks-badge-secondary">⚠️ Page missing</span>',
+    "broken": '<span class="rijks-badge rijks-badge-secondary">⚠️ Image unavailable</span>',
+    "no_public_image": '<span class="rijks-badge rijks-badge-secondary">🚫 No public image</span>',
+}
+
+_NOTES_BADGE_HTML = '<span class="rijks-badge rijks-badge-secondary">📝 Notes</span>'
+_NO_IMAGE_HTML = (
+    '<div class="rijks-card-caption">No valid image available via API.</div>'
+)
+_IMAGES_HIDDEN_HTML = (
+    '<div class="rijks-card-caption">Thumbnails hidden for faster browsing.</div>'
+)
 
 
 def work_kind_badge_html(kind: str) -> str:
     """Return badge HTML for work kind (original / reproduction / photograph)."""
-    k = (kind or "").lower()
-    if k == "original":
-        return '<span class="rijks-badge rijks-badge-secondary">🖼️ Original work</span>'
-    if k == "reproduction":
-        return '<span class="rijks-badge rijks-badge-secondary">🎞️ Reproduction</span>'
-    if k == "photograph":
-        return '<span class="rijks-badge rijks-badge-secondary">📷 Photograph</span>'
-    return ""
+    return _KIND_BADGE_HTML.get((kind or "").lower(), "")
 
 
 def image_status_badge_html(img_status: str) -> str:
     """Return badge for special image status (copyright, missing page, etc.)."""
-    s = (img_status or "").lower()
-    if s == "copyright":
-        return '<span class="rijks-badge rijks-badge-secondary">🔒 Copyright</span>'
-    if s == "page_missing":
-        return '<span class="rijks-badge rijks-badge-secondary">⚠️ Page missing</span>'
-    if s == "broken":
-        return '<span class="rijks-badge rijks-badge-secondary">⚠️ Image unavailable</span>'
-    if s == "no_public_image":
-        return '<span class="rijks-badge rijks-badge-secondary">🚫 No public image</span>'
-    return ""
+    return _IMG_BADGE_HTML.get((img_status or "").lower(), "")
+
+
+def badge_row_html(art: Dict[str, Any], has_notes: bool) -> str:
+    """Badges row (notes, attribution, work kind, image status) for one artwork."""
+    badge_parts: List[str] = []
+    if has_notes:
+        badge_parts.append(_NOTES_BADGE_HTML)
+    # Authorship scope (_attribution from rijks_api)
+    tag = (art.get("_attribution") or "unknown").lower()
+    badge_parts.append(_ATTR_BADGE_HTML.get(tag, _ATTR_BADGE_HTML["unknown"]))
+    work_kind = art.get("_work_kind")
+    if isinstance(work_kind, str) and work_kind:
+        wk_badge = work_kind_badge_html(work_kind)
+        if wk_badge:
+            badge_parts.append(wk_badge)
+    img_status = (art.get("_image_status") or "").lower()
+    if img_status and img_status != "ok":
+        extra = image_status_badge_html(img_status)
+        if extra:
+            badge_parts.append(extra)
+    return '<div class="rijks-badge-row">' + " ".join(badge_parts) + "</div>"
+
 
 # ============================================================
 # Filters
@@ -345,12 +459,16 @@ def passes_filters(
     obj_num: str,
     art: Dict[str, Any],
     notes: Dict[str, str],
-    text_filter: str,
-    artist_filter: str,
+    text_needle: str,
+    artist_needle: str,
     year_min: int,
     year_max: int,
     notes_mode: str,
 ) -> bool:
+    """
+    `text_needle` / `artist_needle` are the filter inputs already stripped and
+    lowercased by the caller (once per pass, not once per artwork).
+    """
     # Notes mode
     note_text = (notes.get(obj_num, "") or "").strip()
     if notes_mode == "with" and not note_text:
@@ -359,21 +477,19 @@ def passes_filters(
         return False
 
     # Artist
-    if artist_filter.strip():
+    if artist_needle:
         artist = (art.get("principalOrFirstMaker") or "").lower()
-        if artist_filter.strip().lower() not in artist:
+        if artist_needle not in artist:
             return False
 
     # Year range
-    dating = art.get("dating") or {}
-    year = extract_year(dating) if isinstance(dating, dict) else None
+    year = art_year(art)
     if isinstance(year, int):
         if year < year_min or year > year_max:
             return False
 
     # Text search in title/artist/materials/places
-    if text_filter.strip():
-        needle = text_filter.strip().lower()
+    if text_needle:
         parts: List[str] = []
 
         for k in ("title", "longTitle", "principalOrFirstMaker"):
@@ -386,7 +502,7 @@ def passes_filters(
             if isinstance(v, list):
                 parts.extend(str(x).lower() for x in v)
 
-        if needle not in " | ".join(parts):
+        if text_needle not in " | ".join(parts):
             return False
 
     return True
@@ -667,7 +783,7 @@ def build_pdf_buffer(
             title = art.get("title") or "Untitled"
             maker = art.get("principalOrFirstMaker") or "Unknown artist"
             dating = art.get("dating") or {}
-            year = extract_year(dating) if isinstance(dating, dict) else None
+            year = art_year(art)
             date_full = dating.get("presentingDate") or (str(year) if year else "")
 
             # ======= TRUNCATION RULES =======
@@ -723,6 +839,32 @@ def build_pdf_buffer(
         c.showPage()
         page_num += 1
 
+    # --------------------------------------------------------
+    # Prefetch thumbnails (and "About" texts) concurrently;
+    # the page loop below then only draws
+    # --------------------------------------------------------
+    def fetch_image_bytes(img_url: str) -> bytes | None:
+        try:
+            resp = requests.get(img_url, timeout=8)
+            return resp.content if resp.ok else None
+        except Exception:
+            # Ignore image errors; the page is drawn text-only
+            return None
+
+    image_urls = {obj_num: cached_best_image_url(art) for obj_num, art in items}
+    image_bytes: Dict[str, bytes | None] = {}
+    if items:
+        with ThreadPoolExecutor(max_workers=PDF_FETCH_WORKERS) as ex:
+            image_futs = {
+                obj_num: ex.submit(fetch_image_bytes, url)
+                for obj_num, url in image_urls.items()
+                if url
+            }
+            if include_about:
+                # Fills about_cache (distinct keys per thread)
+                list(ex.map(get_about_text, [obj_num for obj_num, _ in items]))
+            image_bytes = {obj_num: f.result() for obj_num, f in image_futs.items()}
+
     # --------------------------------------------------------
     # One page per artwork
     # --------------------------------------------------------
@@ -730,7 +872,7 @@ def build_pdf_buffer(
         title = art.get("title") or "Untitled"
         maker = art.get("principalOrFirstMaker") or "Unknown artist"
         dating = art.get("dating") or {}
-        year = extract_year(dating) if isinstance(dating, dict) else None
+        year = art_year(art)
         date_str = dating.get("presentingDate") or (str(year) if year else "")
         link = (art.get("links") or {}).get("web", "")
 
@@ -760,37 +902,35 @@ def build_pdf_buffer(
             c.drawString(margin, y, f"Rijksmuseum (web): {short_link}")
             y -= 20
 
-        # Thumbnail
-        img_url = get_best_image_url(art)
-        if img_url:
+        # Thumbnail (bytes prefetched above)
+        img_content = image_bytes.get(obj_num)
+        if img_content:
             try:
-                resp = requests.get(img_url, timeout=8)
-                if resp.ok:
-                    img_data = io.BytesIO(resp.content)
-                    img = ImageReader(img_data)
-
-                    max_w = width - 2 * margin
-                    max_h = 240   # a bit smaller so we keep room for text
-                    iw, ih = img.getSize()
-                    scale = min(max_w / iw, max_h / ih)
-                    img_w = iw * scale
-                    img_h = ih * scale
-                    img_x = margin
-                    img_y = y - img_h
-                    c.drawImage(
-                        img,
-                        img_x,
-                        img_y,
-                        width=img_w,
-                        height=img_h,
-                        preserveAspectRatio=True,
-                    )
-                    y = img_y - 18
+                img_data = io.BytesIO(img_content)
+                img = ImageReader(img_data)
+
+                max_w = width - 2 * margin
+                max_h = 240   # a bit smaller so we keep room for text
+                iw, ih = img.getSize()
+                scale = min(max_w / iw, max_h / ih)
+                img_w = iw * scale
+                img_h = ih * scale
+                img_x = margin
+                img_y = y - img_h
+                c.drawImage(
+                    img,
+                    img_x,
+                    img_y,
+                    width=img_w,
+                    height=img_h,
+                    preserveAspectRatio=True,
+                )
+                y = img_y - 18
 
-                    # small horizontal separator line
-                    c.setLineWidth(0.3)
-                    c.line(margin, y + 6, width - margin, y + 6)
-                    y -= 10
+                # small horizontal separator line
+                c.setLineWidth(0.3)
+                c.line(margin, y + 6, width - margin, y + 6)
+                y -= 10
             except Exception:
                 # Ignore image errors; continue with a text-only page
                 pass
@@ -948,6 +1088,7 @@ if not favorites:
         "Go to the **Open Collection Research Explorer** page and mark "
         "**In my selection** on any artwork you want to keep."
     )
+    flush_favorites()
     show_global_footer()
     st.stop()
 
@@ -1130,6 +1271,11 @@ filters_active = any(
 filtered_favorites: Dict[str, Any] = favorites
 
 if filters_active:
+    # Normalize the filter inputs once for the whole pass
+    text_needle = text_filter.strip().lower()
+    artist_needle = artist_filter.strip().lower()
+    object_type_needle = object_type_filter.strip().lower()
+
     filtered_favorites = {
         obj_num: art
         for obj_num, art in favorites.items()
@@ -1137,17 +1283,16 @@ if filters_active:
             obj_num=obj_num,
             art=art,
             notes=notes,
-            text_filter=text_filter,
-            artist_filter=artist_filter,
+            text_needle=text_needle,
+            artist_needle=artist_needle,
             year_min=year_min,
             year_max=year_max,
             # Notes filter handled later (with/without/all)
             notes_mode="any",
         )
         and (
-            not object_type_filter.strip()
-            or object_type_filter.strip().lower()
-            in ", ".join(art.get("objectTypes") or []).lower()
+            not object_type_needle
+            or object_type_needle in ", ".join(art.get("objectTypes") or []).lower()
         )
     }
 
@@ -1370,11 +1515,7 @@ if st.session_state.get("confirm_clear_selection", False):
         # Clear favorites in memory and on disk
         st.session_state["favorites"] = {}
         favorites = {}
-        try:
-            with open(FAV_FILE, "w", encoding="utf-8") as f:
-                json.dump({}, f, ensure_ascii=False, indent=2)
-        except Exception:
-            pass
+        write_snapshot({})
 
         # Reset compare candidates and PDF buffer
         st.session_state["compare_candidates"] = []
@@ -1567,12 +1708,7 @@ else:
                         favorites[obj_num] = art
 
                 # Persist updated favorites
-                st.session_state["favorites"] = favorites
-                try:
-                    with open(FAV_FILE, "w", encoding="utf-8") as f:
-                        json.dump(favorites, f, ensure_ascii=False, indent=2)
-                except Exception:
-                    pass
+                save_favorites(favorites)
 
                 # Reset comparison candidates and checkbox generation
                 st.session_state["compare_candidates"] = []
@@ -1635,19 +1771,19 @@ else:
             return
 
         favorites[obj_num] = art
-        st.session_state["favorites"] = favorites
-        try:
-            with open(FAV_FILE, "w", encoding="utf-8") as f:
-                json.dump(favorites, f, ensure_ascii=False, indent=2)
-        except Exception:
-            pass
+        save_favorite_change(favorites, "add", obj_num, art)
 
     def render_cards(items: List[Tuple[str, Dict[str, Any]]], allow_compare: bool) -> None:
-        for start_idx in range(0, len(items), cards_per_row):
-            row_items = items[start_idx : start_idx + cards_per_row]
-            cols = st.columns(len(row_items))
+        # Row widths up front; rows draw from one iterator instead of slices
+        # (zip pulls from `cols` first, so no item is skipped)
+        full_rows, remainder = divmod(len(items), cards_per_row)
+        row_widths = [cards_per_row] * full_rows + ([remainder] if remainder else [])
+        items_iter = iter(items)
+
+        for width in row_widths:
+            cols = st.columns(width)
 
-            for col, (obj_num, art) in zip(cols, row_items):
+            for col, (obj_num, art) in zip(cols, items_iter):
                 with col:
                     note_for_this = notes.get(obj_num, "")
                     has_notes_flag = isinstance(note_for_this, str) and note_for_this.strip()
@@ -1660,22 +1796,19 @@ else:
                     if art.get("_compare_candidate"):
                         card_classes += " rijks-card-compare-candidate"
 
-                    st.markdown(
-                        f'<div class="{card_classes}">', unsafe_allow_html=True
-                    )
-
                     # Thumbnail
                     if show_images:
                         img_url = cached_best_image_url(art)
                         if img_url:
-                            try:
-                                st.image(img_url, width="stretch")
-                            except Exception:
-                                st.write("Error displaying image.")
+                            # Card-sized thumbnail, fetched only when scrolled near
+                            img_html = (
+                                f'<img src="{escape(get_thumbnail_url(img_url))}" alt="" '
+                                'loading="lazy" decoding="async">'
+                            )
                         else:
-                            st.write("No valid image available via API.")
+                            img_html = _NO_IMAGE_HTML
                     else:
-                        st.caption("Thumbnails hidden for faster browsing.")
+                        img_html = _IMAGES_HIDDEN_HTML
 
                     # Basic metadata — pick the best possible title
                     obj_num_str = (obj_num or "").strip()
@@ -1702,55 +1835,28 @@ else:
                     presenting_date = dating.get("presentingDate")
                     year = dating.get("year")
 
-                    st.markdown(
-                        f'<div class="rijks-card-title">{title}</div>',
-                        unsafe_allow_html=True,
-                    )
-                    st.markdown(
-                        f'<div class="rijks-card-caption">{maker}</div>',
-                        unsafe_allow_html=True,
-                    )
-
                     # Badges row: notes, attribution, work kind, image status
-                    badge_parts: List[str] = []
-
-                    if has_notes_flag:
-                        badge_parts.append(
-                            '<span class="rijks-badge rijks-badge-secondary">📝 Notes</span>'
-                        )
-
-                    # Authorship scope badge (_attribution from rijks_api)
-                    badge_parts.append(attribution_badge_html(art))
-
-                    # Work kind badge (_work_kind from rijks_api: original / reproduction / photograph)
-                    work_kind = art.get("_work_kind")
-                    if isinstance(work_kind, str) and work_kind:
-                        wk_badge = work_kind_badge_html(work_kind)
-                        if wk_badge:
-                            badge_parts.append(wk_badge)
-
-                    # Image status badge (if we know there is any issue or restriction)
-                    img_status = (art.get("_image_status") or "").lower()
-                    if img_status and img_status != "ok":
-                        extra = image_status_badge_html(img_status)
-                        if extra:
-                            badge_parts.append(extra)
-
-                    if badge_parts:
-                        st.markdown(
-                            '<div class="rijks-badge-row">' + " ".join(badge_parts) + "</div>",
-                            unsafe_allow_html=True,
-                        )
+                    badge_row = badge_row_html(art, has_notes_flag)
 
+                    meta_lines: List[str] = []
                     if presenting_date:
-                        st.text(f"Date: {presenting_date}")
+                        meta_lines.append(f"Date: {presenting_date}")
                     elif year:
-                        st.text(f"Year: {year}")
-
-                    st.text(f"Object ID: {obj_num}")
-
-                    if web_link:
-                        st.markdown(f"[View on Rijksmuseum website]({web_link})")
+                        meta_lines.append(f"Year: {year}")
+                    meta_lines.append(f"Object ID: {obj_num}")
+
+                    # Static part of the card in one element; widgets follow
+                    st.html(
+                        _card_html(
+                            card_classes,
+                            img_html,
+                            title,
+                            maker,
+                            badge_row,
+                            meta_lines,
+                            web_link,
+                        )
+                    )
 
                     # Extra metadata
                     with st.expander("More details"):
@@ -1760,18 +1866,21 @@ else:
                         techniques = art.get("techniques")
                         production_places = art.get("productionPlaces")
 
+                        details: List[str] = []
                         if long_title and long_title != title:
-                            st.write(f"**Long title:** {long_title}")
+                            details.append(f"**Long title:** {long_title}")
                         if object_types:
-                            st.write(f"**Object type(s):** {', '.join(object_types)}")
+                            details.append(f"**Object type(s):** {', '.join(object_types)}")
                         if materials:
-                            st.write(f"**Materials:** {', '.join(materials)}")
+                            details.append(f"**Materials:** {', '.join(materials)}")
                         if techniques:
-                            st.write(f"**Techniques:** {', '.join(techniques)}")
+                            details.append(f"**Techniques:** {', '.join(techniques)}")
                         if production_places:
-                            st.write(
-                                f"**Production place(s): {', '.join(production_places)}"
+                            details.append(
+                                f"**Production place(s):** {', '.join(production_places)}"
                             )
+                        if details:
+                            st.markdown("\n\n".join(details))
 
                     # Compare checkbox
                     if allow_compare and obj_num:
@@ -1808,12 +1917,7 @@ else:
                             },
                         )
                         favorites.pop(obj_num, None)
-                        st.session_state["favorites"] = favorites
-                        try:
-                            with open(FAV_FILE, "w", encoding="utf-8") as f:
-                                json.dump(favorites, f, ensure_ascii=False, indent=2)
-                        except Exception:
-                            pass
+                        save_favorite_change(favorites, "del", obj_num)
 
                         if st.session_state.get("detail_art_id") == obj_num:
                             st.session_state["detail_art_id"] = None
@@ -1834,8 +1938,6 @@ else:
                         st.success("Artwork removed from your selection.")
                         st.rerun()
 
-                    st.markdown("</div>", unsafe_allow_html=True)
-
     # =========================================================
     # MODE A) GROUP BY ARTIST
     # =========================================================
@@ -2063,7 +2165,7 @@ else:
 
         # --------- New layout: single-column detail view ---------
 
-        img_url = get_best_image_url(art)
+        img_url = cached_best_image_url(art)
 
         raw_title = (art.get("title") or "").strip()
         long_title = (art.get("longTitle") or "").strip()
@@ -2096,10 +2198,11 @@ else:
             st.write("No valid image available via API.")
 
         # Metadata right below the image, in a slightly smaller font size
+        # (API text is escaped: this block is raw HTML)
         meta_parts = [
-            f"<strong>Title:</strong> {title}",
-            f"<strong>Artist:</strong> {maker}",
-            f"<strong>Object ID:</strong> {detail_id}",
+            f"<strong>Title:</strong> {escape(title)}",
+            f"<strong>Artist:</strong> {escape(str(maker))}",
+            f"<strong>Object ID:</strong> {escape(detail_id)}",
         ]
 
         if presenting_date:
@@ -2114,7 +2217,7 @@ else:
         production_places = art.get("productionPlaces")
 
         if long_title_meta and long_title_meta != title:
-            meta_parts.append(f"<strong>Long title:</strong> {long_title_meta}")
+            meta_parts.append(f"<strong>Long title:</strong> {escape(long_title_meta)}")
         if object_types:
             meta_parts.append(
                 f"<strong>Object type(s):</strong> {', '.join(object_types)}"
@@ -2131,7 +2234,7 @@ else:
 
         if web_link:
             meta_parts.append(
-                f'<a href="{web_link}" target="_blank">'
+                f'<a href="{escape(web_link)}" target="_blank">'
                 f"Open on Rijksmuseum website for full zoom</a>"
             )
 
@@ -2145,37 +2248,11 @@ else:
         )
 
         # Badges row in detail view: notes, attribution, work kind, image status
-        badge_parts: List[str] = []
-
-        # Notes badge (if there is a saved note for this artwork)
         note_text_detail = (notes.get(detail_id, "") or "").strip()
-        if note_text_detail:
-            badge_parts.append(
-                '<span class="rijks-badge rijks-badge-secondary">📝 Notes</span>'
-            )
-
-        # Authorship scope badge (_attribution from rijks_api)
-        badge_parts.append(attribution_badge_html(art))
-
-        # Work kind badge (original / reproduction / photograph)
-        wk = art.get("_work_kind")
-        if isinstance(wk, str) and wk:
-            wk_badge = work_kind_badge_html(wk)
-            if wk_badge:
-                badge_parts.append(wk_badge)
-
-        # Image status badge (copyright / missing / broken / no public image)
-        img_status_detail = (art.get("_image_status") or "").lower()
-        if img_status_detail and img_status_detail != "ok":
-            extra = image_status_badge_html(img_status_detail)
-            if extra:
-                badge_parts.append(extra)
-
-        if badge_parts:
-            st.markdown(
-                '<div class="rijks-badge-row">' + " ".join(badge_parts) + "</div>",
-                unsafe_allow_html=True,
-            )
+        st.markdown(
+            badge_row_html(art, bool(note_text_detail)),
+            unsafe_allow_html=True,
+        )
 
         # --------- Research notes (same behaviour as before) ---------
         st.markdown("### 📝 Research notes")
@@ -2216,12 +2293,7 @@ else:
                 },
             )
             favorites.pop(detail_id, None)
-            st.session_state["favorites"] = favorites
-            try:
-                with open(FAV_FILE, "w", encoding="utf-8") as f:
-                    json.dump(favorites, f, ensure_ascii=False, indent=2)
-            except Exception:
-                pass
+            save_favorite_change(favorites, "del", detail_id)
 
             notes.pop(detail_id, None)
             save_notes(notes)
@@ -2237,4 +2309,7 @@ else:
     # ============================================================
     # Footer
     # ============================================================
-    show_global_footer()
\ No newline at end of file
+    show_global_footer()
+
+# One snapshot write per run, however many changes asked for it
+flush_favorites()
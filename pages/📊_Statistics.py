@@ -9,7 +9,8 @@ from typing import Any, Dict, Iterable, List
 
 import streamlit as st
 
-from app_paths import ANALYTICS_LOG_FILE, FAV_FILE
+from app_paths import ANALYTICS_LOG_FILE
+from favorites_store import load_favorites_from_disk
 from analytics import track_event_once
 from ui_theme import inject_global_css, show_global_footer, show_page_intro
 
@@ -153,16 +154,8 @@ def _read_jsonl(path) -> List[Dict[str, Any]]:
 
 
 def _load_favorites_count() -> int:
-    """Return how many artworks are currently in favorites.json."""
-    try:
-        if FAV_FILE.exists():
-            with open(FAV_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, dict):
-                return len(data)
-    except Exception:
-        pass
-    return 0
+    """Return how many artworks are currently saved (snapshot + journal)."""
+    return len(load_favorites_from_disk())
 
 
 def _parse_timestamp(ev: Dict[str, Any]) -> datetime | None:
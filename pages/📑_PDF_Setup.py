@@ -20,9 +20,11 @@ from __future__ import annotations
 import json
 from typing import Dict, Any
 
+import orjson
 import streamlit as st
 
-from app_paths import PDF_META_FILE, FAV_FILE
+from app_paths import PDF_META_FILE
+from favorites_store import load_favorites_from_disk
 from analytics import track_event, track_event_once
 from ui_theme import inject_global_css, show_global_footer, show_page_intro
 
@@ -96,8 +98,8 @@ def load_pdf_meta() -> Dict[str, Any]:
     base = _default_pdf_meta()
     if PDF_META_FILE.exists():
         try:
-            with open(PDF_META_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(PDF_META_FILE, "rb") as f:
+                data = orjson.loads(f.read())
             if isinstance(data, dict):
                 base.update(data)
         except Exception:
@@ -140,15 +142,8 @@ def load_selection_count() -> int:
     if isinstance(favorites, dict):
         return len(favorites)
 
-    try:
-        if FAV_FILE.exists():
-            with open(FAV_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return len(data) if isinstance(data, dict) else 0
-    except Exception:
-        pass
-
-    return 0
+    # Snapshot + journal of single toggles (see favorites_store)
+    return len(load_favorites_from_disk())
 
 
 # ============================================================
@@ -14,16 +14,17 @@ Key rules:
 
 from __future__ import annotations  # Must be the first import
 
-import json
+from html import escape
 from typing import Any, Dict, List, Tuple
 
 import streamlit as st
 
 from ui_theme import inject_global_css, show_global_footer, show_page_intro
-from app_paths import FAV_FILE
+from favorites_store import load_favorites_from_disk
 from analytics import track_event
 from rijks_api import (
     get_best_image_url,
+    get_thumbnail_url,
     fetch_metadata_by_objectnumber,
     RijksAPIError,
 )
@@ -60,6 +61,12 @@ st.markdown(
         box-shadow: 0 0 0 1px #ffb347, 0 6px 22px rgba(0,0,0,0.9);
         background: radial-gradient(circle at top left, #272015 0, #181818 55%);
     }
+    .cmp-card img {
+        width: 100%;
+        height: auto;
+        border-radius: 8px;
+        margin-bottom: 0.4rem;
+    }
     .cmp-card-header {
         font-size: 0.78rem;
         text-transform: uppercase;
@@ -86,18 +93,6 @@ st.markdown(
 # ============================================================
 # Data helpers
 # ============================================================
-def load_favorites_from_disk() -> Dict[str, Any]:
-    """Load the favorites JSON file from disk, if available."""
-    if FAV_FILE.exists():
-        try:
-            with open(FAV_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f) or {}
-            return data if isinstance(data, dict) else {}
-        except Exception:
-            return {}
-    return {}
-
-
 def get_compare_candidates(favorites: Dict[str, Any]) -> List[str]:
     """Return objectNumbers marked as comparison candidates inside favorites."""
     return [
@@ -223,28 +218,27 @@ for col, (obj_id, art) in zip(cols, candidate_arts):
     card_classes = "cmp-card" + (" cmp-card-selected" if is_selected else "")
 
     with col:
-        st.markdown(f'<div class="{card_classes}">', unsafe_allow_html=True)
-        st.markdown(
-            '<div class="cmp-card-header">CANDIDATE</div>', unsafe_allow_html=True
-        )
-
+        # Static part of the card (header, image, title, artist, ID) as one element
         img_url = get_best_image_url(art)
         if img_url:
-            st.image(img_url, width="stretch")
+            img_html = (
+                f'<img src="{escape(get_thumbnail_url(img_url))}" alt="" '
+                'loading="lazy" decoding="async">'
+            )
         else:
-            st.caption("No public image available in current mapping.")
-
-        st.markdown(
-            f'<div class="rijks-card-title">{art.get("title", "Untitled")}</div>',
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            f'<div class="rijks-card-caption">{art.get("principalOrFirstMaker", "Unknown artist")}</div>',
-            unsafe_allow_html=True,
-        )
-        st.markdown(
-            f'<span class="cmp-card-objectid">{obj_id}</span>',
-            unsafe_allow_html=True,
+            img_html = (
+                '<div class="rijks-card-caption">'
+                "No public image available in current mapping.</div>"
+            )
+        st.html(
+            f'<div class="{card_classes}">'
+            '<div class="cmp-card-header">CANDIDATE</div>'
+            f"{img_html}"
+            f'<div class="rijks-card-title">{escape(str(art.get("title", "Untitled")))}</div>'
+            '<div class="rijks-card-caption">'
+            f'{escape(str(art.get("principalOrFirstMaker", "Unknown artist")))}</div>'
+            f'<span class="cmp-card-objectid">{escape(obj_id)}</span>'
+            "</div>"
         )
 
         st.checkbox(
@@ -254,8 +248,6 @@ for col, (obj_id, art) in zip(cols, candidate_arts):
             kwargs={"changed_id": obj_id},
         )
 
-        st.markdown("</div>", unsafe_allow_html=True)
-
 if st.session_state.pop("cmp_pair_warning", False):
     st.warning("Please keep **at most** 2 artworks selected for comparison.")
 
@@ -296,6 +288,12 @@ if DEV_MODE:
 
 col_a, col_b = st.columns(2)
 
+_WORK_KIND_LABELS = {
+    "original": "Original work",
+    "reproduction": "Reproduction (print / engraving / etc.)",
+    "photograph": "Photograph",
+}
+
 
 def render_side(label: str, obj_id: str, art: Dict[str, Any], container) -> None:
     """Render one side of the A/B comparison."""
@@ -308,30 +306,29 @@ def render_side(label: str, obj_id: str, art: Dict[str, Any], container) -> None
         else:
             st.caption("No public image available in current mapping.")
 
-        st.write(f"**Title:** {art.get('title', 'Untitled')}")
-        st.write(f"**Artist:** {art.get('principalOrFirstMaker', 'Unknown artist')}")
+        meta_lines = [
+            f"**Title:** {art.get('title', 'Untitled')}",
+            f"**Artist:** {art.get('principalOrFirstMaker', 'Unknown artist')}",
+        ]
 
         # Work type (original / reproduction / photograph), if available
         work_kind = (art.get("_work_kind") or "").lower()
-        if work_kind in ("original", "reproduction", "photograph"):
-            label_map = {
-                "original": "Original work",
-                "reproduction": "Reproduction (print / engraving / etc.)",
-                "photograph": "Photograph",
-            }
-            human_label = label_map.get(work_kind, work_kind.title())
-            st.write(f"**Work type:** {human_label}")
+        if work_kind in _WORK_KIND_LABELS:
+            meta_lines.append(f"**Work type:** {_WORK_KIND_LABELS[work_kind]}")
 
         dating = art.get("dating", {}) or {}
         date = dating.get("presentingDate") or dating.get("year")
         if date:
-            st.write(f"**Date:** {date}")
+            meta_lines.append(f"**Date:** {date}")
 
-        st.write(f"**Object ID:** `{obj_id}`")
+        meta_lines.append(f"**Object ID:** `{obj_id}`")
 
         link = (art.get("links") or {}).get("web")
         if link:
-            st.markdown(f"[View on Rijksmuseum website]({link})")
+            meta_lines.append(f"[View on Rijksmuseum website]({link})")
+
+        # One markdown element for the whole metadata block
+        st.markdown("\n\n".join(meta_lines))
 
 
 render_side("Artwork A", id_a, art_a, col_a)
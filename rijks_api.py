@@ -20,14 +20,31 @@ Notes:
 
 from __future__ import annotations
 
+import os
 import re
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 import streamlit as st
+import threading
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+__all__ = [
+    "RijksAPIError",
+    "SearchParams",
+    "search_artworks",
+    "extract_year",
+    "get_best_image_url",
+    "get_thumbnail_url",
+    "probe_image_url",
+    "fetch_metadata_by_objectnumber",
+    "load_metadata_by_objectnumber",
+    "resolve_objectnumber_to_pid",
+]
 
 # ============================================================
 # Constants
@@ -46,6 +63,22 @@ MAX_RESULTS_PER_SEARCH = 120
 # Common Rijksmuseum inventory prefixes
 CANONICAL_PREFIXES = ("SK-", "RP-", "BK-", "NG-", "AK-", "NM-")
 
+# Decoded JSON only ever contains exact dict/list/str nodes, so the recursive
+# walkers use `type(x) is ...` checks instead of isinstance().
+_CONTAINER_TYPES = frozenset({dict, list})
+
+# Shared, allocation-free fallback for missing list fields (`x.get(k) or _EMPTY`)
+_EMPTY: Tuple[Any, ...] = ()
+
+# Leading 4-digit year of an ISO-like date string ("1642", "1642-01-01T...")
+_YEAR_RE = re.compile(r"^(\d{4})")
+# IIIF image URL tail: /full/{size}/{rotation}/{quality}.{format}
+_IIIF_SIZE_RE = re.compile(r"/full/[^/]+/([^/]+/[^/]+)$")
+# Google-hosted image URL size suffix (=s0, =s2000, ...)
+_GOOGLE_SIZE_RE = re.compile(r"=s\d+$")
+
+THUMBNAIL_SIZE = 400
+
 # ============================================================
 # Runtime flags
 # ============================================================
@@ -53,7 +86,9 @@ RESOLVE_IMAGES_DURING_SEARCH = True
 
 DEBUG_RIJKS = False
 DEBUG_PERFORMANCE = False
-DEBUG_IMAGE_RESOLUTION = False
+# Image-resolution tracing prints resolver payloads on the hot path;
+# keep it off unless explicitly requested (RIJKS_DEBUG_IMAGES=1).
+DEBUG_IMAGE_RESOLUTION = os.environ.get("RIJKS_DEBUG_IMAGES") == "1"
 
 # HTML lookup improves some missing artist/role/image-status cases,
 # but it costs one extra public-page request per artwork when used.
@@ -71,6 +106,16 @@ class RijksAPIError(RuntimeError):
     """Raised when Rijksmuseum Data Services fails or returns unexpected data."""
 
 
+# ============================================================
+# Small parsing helpers
+# ============================================================
+
+def _parse_year(value: Any) -> Optional[int]:
+    """Return the leading 4-digit year of `value`, or None."""
+    m = _YEAR_RE.match(value) if isinstance(value, str) else None
+    return int(m.group(1)) if m else None
+
+
 # ============================================================
 # Search params
 # ============================================================
@@ -88,25 +133,58 @@ class SearchParams:
 # HTTP session
 # ============================================================
 
+# One pooled session per process: keep-alive connections are reused across
+# searches, and the pool is large enough for the resolver thread fan-out.
+HTTP_POOL_SIZE = 32
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
 def _get_session() -> requests.Session:
-    """Configured HTTP session."""
-    s = requests.Session()
-    s.headers.update({"User-Agent": "OpenCollectionResearchExplorer/1.0"})
-    return s
+    """Shared, configured HTTP session (created on first use)."""
+    global _SESSION
+
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                s = requests.Session()
+                s.headers.update({"User-Agent": "OpenCollectionResearchExplorer/1.0"})
+
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_SIZE,
+                    pool_maxsize=HTTP_POOL_SIZE,
+                    max_retries=Retry(
+                        total=2,
+                        backoff_factor=0.2,
+                        # No 429: its Retry-After would be honoured and can
+                        # stall a search worker (and the run) for any time
+                        status_forcelist=(500, 502, 503, 504),
+                        allowed_methods=frozenset({"GET", "HEAD"}),
+                        # Hand the last response back so callers keep their
+                        # own `resp.ok` handling instead of a RetryError.
+                        raise_on_status=False,
+                    ),
+                )
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                _SESSION = s
+
+    return _SESSION
 
 
 # ============================================================
 # Network probe (used by UI)
 # ============================================================
 
-@st.cache_data(show_spinner=False, ttl=24 * 3600)
+@st.cache_data(show_spinner=False, ttl=24 * 3600, max_entries=2048)
 def probe_image_url(url: str) -> Dict[str, Any]:
     """
     Lightweight validation to distinguish:
       - ok
       - copyright (403/451)
       - broken (404/5xx/not-image/etc.)
-    Cached for 24h to avoid repeated network calls.
+    Cached for 24h (bounded to 2048 URLs) to avoid repeated network calls.
 
     Returns a dict shaped for the UI:
       - ok: bool
@@ -121,17 +199,22 @@ def probe_image_url(url: str) -> Dict[str, Any]:
     u = url.strip()
     headers = {"User-Agent": "Mozilla/5.0"}
 
+    # Shared pooled session: the Explorer probes a page's images concurrently,
+    # so keep-alive connections are reused instead of a new TLS handshake each.
+    session = _get_session()
+
     try:
         # Try HEAD first (cheap)
-        r = requests.head(u, timeout=8, allow_redirects=True, headers=headers)
+        r = session.head(u, timeout=8, allow_redirects=True, headers=headers)
         http_status = int(r.status_code)
         ctype = (r.headers.get("Content-Type") or "").lower().strip()
 
         # Fallback to GET when HEAD is blocked or missing headers
         if http_status in (405,) or not ctype:
-            r = requests.get(u, timeout=10, stream=True, allow_redirects=True, headers=headers)
-            http_status = int(r.status_code)
-            ctype = (r.headers.get("Content-Type") or "").lower().strip()
+            # Streamed: only headers are read; closing returns the connection to the pool
+            with session.get(u, timeout=10, stream=True, allow_redirects=True, headers=headers) as r:
+                http_status = int(r.status_code)
+                ctype = (r.headers.get("Content-Type") or "").lower().strip()
 
         if http_status == 200 and ctype.startswith("image/"):
             return {"ok": True, "status": "ok", "http_status": http_status, "content_type": ctype, "reason": "ok"}
@@ -231,7 +314,7 @@ def _search_ids(session: requests.Session, query: str, limit: int) -> List[str]:
             )
 
         data = resp.json()
-        items = data.get("orderedItems") or data.get("items") or []
+        items = data.get("orderedItems") or data.get("items") or _EMPTY
 
         for item in items:
             pid = item.get("id")
@@ -260,17 +343,39 @@ def _fetch_linked_art_json(session: requests.Session, pid_url: str) -> Dict[str,
 
 
 @st.cache_data(show_spinner=False, ttl=7 * 24 * 3600)
-def _fetch_linked_art_json_cached(pid_url: str) -> Dict[str, Any]:
-    """Cached wrapper around the Linked Art resolver."""
-    session = _get_session()
-    url = f"{pid_url.split('?')[0]}?_profile=la&_mediatype=application/ld+json"
-    resp = session.get(url, timeout=DETAIL_TIMEOUT)
-    if not resp.ok:
-        raise RijksAPIError(
-            f"Resolver error for {url} ({resp.status_code}): {resp.text[:200]}"
-        )
-    obj = resp.json()
-    return obj if isinstance(obj, dict) else {}
+def _fetch_linked_art_json_cached(
+        pid_url: str,
+        _session: Optional[requests.Session] = None,
+) -> Dict[str, Any]:
+    """
+    Cached wrapper around the Linked Art resolver.
+
+    `_session` is excluded from the cache key (leading underscore), so callers
+    can share one session across threads without affecting cache hits.
+    """
+    return _fetch_linked_art_json(_session or _get_session(), pid_url)
+
+
+def _safe_fetch(session: requests.Session, pid_url: str) -> Optional[Dict[str, Any]]:
+    """Fetch one PID for the thread pool; resolver errors are logged and skipped."""
+    try:
+        return _fetch_linked_art_json_cached(pid_url, _session=session)
+    except RijksAPIError as exc:
+        print(f"[rijks_api] Warning: failed to fetch {pid_url}: {exc}")
+        return None
+
+
+def _fetch_and_map(session: requests.Session, pid_url: str) -> Optional[Dict[str, Any]]:
+    """Resolve and map one PID (one pipeline stage per worker); failures are skipped."""
+    raw = _safe_fetch(session, pid_url)
+    if raw is None:
+        return None
+
+    try:
+        return _map_linked_art_to_legacy_dict(raw)
+    except Exception as exc:
+        print(f"[rijks_api] Warning: failed to map object: {exc}")
+        return None
 
 
 # ============================================================
@@ -286,9 +391,15 @@ def _extract_access_point_url(raw: Dict[str, Any]) -> Optional[str]:
     the preferred image flow via `shows -> digitally_shown_by -> access_point`
     does not return a result.
     """
+    # Iterative pre-order DFS: stops at the first hit and never enters
+    # leaf primitives (children are pushed reversed to keep document order).
+    stack: List[Any] = [raw]
+
+    while stack:
+        obj = stack.pop()
+        t = type(obj)
 
-    def walk(obj: Any) -> Optional[str]:
-        if isinstance(obj, dict):
+        if t is dict:
             ap = obj.get("access_point")
             if isinstance(ap, list) and ap:
                 first = ap[0]
@@ -297,20 +408,12 @@ def _extract_access_point_url(raw: Dict[str, Any]) -> Optional[str]:
                     if isinstance(u, str) and u.strip():
                         return u.strip()
 
-            for v in obj.values():
-                hit = walk(v)
-                if hit:
-                    return hit
+            stack.extend(v for v in reversed(obj.values()) if type(v) in _CONTAINER_TYPES)
 
-        elif isinstance(obj, list):
-            for it in obj:
-                hit = walk(it)
-                if hit:
-                    return hit
-
-        return None
+        elif t is list:
+            stack.extend(v for v in reversed(obj) if type(v) in _CONTAINER_TYPES)
 
-    return walk(raw)
+    return None
 
 
 def _clean_object_page_url(url: str) -> str:
@@ -377,6 +480,21 @@ def _extract_iiif_from_html(html: str) -> Optional[str]:
     return None
 
 
+_IIIF_RANK_INFO_JSON = 0
+_IIIF_RANK_IIIF = 1
+_IIIF_RANK_NONE = 2
+
+
+def _iiif_candidate_rank(url: str) -> int:
+    """Integer preference for IIIF candidates (lower is better)."""
+    lu = url.lower()
+    if lu.endswith("/info.json"):
+        return _IIIF_RANK_INFO_JSON
+    if "iiif" in lu:
+        return _IIIF_RANK_IIIF
+    return _IIIF_RANK_NONE
+
+
 def _deep_find_iiif_image_url(raw: Dict[str, Any]) -> Optional[str]:
     """
     Find a likely IIIF endpoint URL inside the Linked Art JSON.
@@ -391,26 +509,23 @@ def _deep_find_iiif_image_url(raw: Dict[str, Any]) -> Optional[str]:
     candidates: List[str] = []
 
     def walk(node: Any) -> None:
-        if isinstance(node, dict):
+        t = type(node)
+        if t is dict:
             for v in node.values():
                 walk(v)
-        elif isinstance(node, list):
+        elif t is list:
             for v in node:
                 walk(v)
-        elif isinstance(node, str) and node.startswith("http"):
+        elif t is str and node.startswith("http"):
             candidates.append(node)
 
     walk(raw)
 
-    for url in candidates:
-        if url.lower().endswith("/info.json"):
-            return url
-
-    for url in candidates:
-        if "iiif" in url.lower():
-            return url
-
-    return None
+    # Single O(N) pass; `min` keeps the first URL among equal ranks.
+    best = min(candidates, key=_iiif_candidate_rank, default=None)
+    if best is None or _iiif_candidate_rank(best) == _IIIF_RANK_NONE:
+        return None
+    return best
 
 
 @st.cache_data(show_spinner=False, ttl=7 * 24 * 3600)
@@ -420,7 +535,7 @@ def _fetch_public_object_html(url: str, timeout: int = 12) -> Optional[str]:
         return None
 
     try:
-        resp = requests.get(
+        resp = _get_session().get(
             url.strip(),
             timeout=timeout,
             headers={"User-Agent": "Mozilla/5.0"},
@@ -548,6 +663,37 @@ def _extract_creator_and_role_from_object_html(html: str) -> Tuple[Optional[str]
     return None, None
 
 
+@dataclass(frozen=True)
+class _PublicPageFacts:
+    """What the mapper needs from a public object page, parsed once."""
+    artist: Optional[str] = None
+    creator_name: Optional[str] = None
+    creator_role: Optional[str] = None
+    image_status: str = "no_public_image"
+
+
+_NO_PUBLIC_PAGE_FACTS = _PublicPageFacts()
+
+
+def _public_page_facts(url: str) -> _PublicPageFacts:
+    """
+    Fetch (cached, see _fetch_public_object_html) and parse a public object
+    page into the facts the mapper needs.
+    """
+    html = _fetch_public_object_html(url, timeout=DETAIL_TIMEOUT)
+    if not html:
+        return _NO_PUBLIC_PAGE_FACTS
+
+    creator_name, creator_role = _extract_creator_and_role_from_object_html(html)
+
+    return _PublicPageFacts(
+        artist=_extract_artist_from_object_html(html),
+        creator_name=creator_name,
+        creator_role=creator_role,
+        image_status=_detect_image_status_from_object_html(html),
+    )
+
+
 def _extract_iiif_from_access_point_node(access_point: Any) -> Optional[str]:
     """
     Extract a usable IIIF URL from an access_point node.
@@ -634,7 +780,7 @@ def _extract_image_url_from_shows_flow(raw: Dict[str, Any]) -> Optional[str]:
       - embedded VisualItem records
       - VisualItem references that must be resolved via their `id`
     """
-    shows = raw.get("shows") or []
+    shows = raw.get("shows") or _EMPTY
     if isinstance(shows, dict):
         shows = [shows]
     if not isinstance(shows, list):
@@ -673,7 +819,7 @@ def _extract_image_url_from_shows_flow(raw: Dict[str, Any]) -> Optional[str]:
                 if isinstance(resolved_visual_item, dict) and resolved_visual_item:
                     visual_item_data = resolved_visual_item
 
-        digital_objects = visual_item_data.get("digitally_shown_by") or []
+        digital_objects = visual_item_data.get("digitally_shown_by") or _EMPTY
         if isinstance(digital_objects, dict):
             digital_objects = [digital_objects]
         if not isinstance(digital_objects, list):
@@ -762,8 +908,13 @@ def _extract_image_url_from_linked_art(raw: Dict[str, Any]) -> Optional[str]:
 # Authorship classification (research tag)
 # ============================================================
 
-def _collect_attribution_texts(raw: Dict[str, Any]) -> List[str]:
-    """Collect attribution-related short texts from produced_by.*.referred_to_by."""
+def _collect_attribution_texts(raw: Dict[str, Any], lowercase: bool = False) -> List[str]:
+    """
+    Collect attribution-related short texts from produced_by.*.referred_to_by.
+
+    With `lowercase=True` each text is lowercased as it is collected, so
+    callers can join the result directly without a second full-size copy.
+    """
     texts: List[str] = []
     produced_by = raw.get("produced_by")
     if not isinstance(produced_by, dict):
@@ -772,15 +923,15 @@ def _collect_attribution_texts(raw: Dict[str, Any]) -> List[str]:
     def pull(obj: Any) -> None:
         if not isinstance(obj, dict):
             return
-        for item in (obj.get("referred_to_by") or []):
+        for item in (obj.get("referred_to_by") or _EMPTY):
             if isinstance(item, dict):
                 c = item.get("content")
                 if isinstance(c, str) and c.strip():
-                    texts.append(c.strip())
+                    texts.append(c.strip().lower() if lowercase else c.strip())
 
     pull(produced_by)
 
-    parts = produced_by.get("part") or []
+    parts = produced_by.get("part") or _EMPTY
     if isinstance(parts, list):
         for p in parts:
             pull(p)
@@ -788,6 +939,40 @@ def _collect_attribution_texts(raw: Dict[str, Any]) -> List[str]:
     return texts
 
 
+# (tag, substring phrases, whole-word tokens), checked in order.
+_ATTRIBUTION_RULES: Tuple[Tuple[str, Tuple[str, ...], frozenset], ...] = (
+    # 1) Direct maker roles should be checked before "after"
+    # because prints may contain both "printmaker" and "after design by".
+    (
+        "direct",
+        (
+            "painter:",
+            "schilder:",
+            "artist:",
+            "maker:",
+            "printmaker:",
+            "prentmaker:",
+            "engraver:",
+            "graveur:",
+            "etcher:",
+            "designer:",
+            "draftsman:",
+            "gemaakt door",
+        ),
+        frozenset({"door"}),
+    ),
+    # 2) Attribution variants
+    ("attributed", ("attributed to", "toegeschreven aan", "zugeschrieben", "attribué à"), frozenset()),
+    ("workshop", ("workshop of", "atelier van", "werkplaats", "atelier de"), frozenset()),
+    ("circle", ("circle of", "kring van", "school of", "navolger", "follower of", "cercle de"), frozenset()),
+    ("after", ("d'après", "copy after", "kopie naar"), frozenset({"after", "naar", "nach"})),
+)
+
+# Word tokens of the attribution text: punctuation is not part of a token, so
+# "(after rembrandt)" yields "after" and "door:" yields "door"
+_WORD_RE = re.compile(r"\w+")
+
+
 def _classify_attribution(raw: Dict[str, Any], artist_name: str) -> str:
     """
     Returns:
@@ -805,45 +990,18 @@ def _classify_attribution(raw: Dict[str, Any], artist_name: str) -> str:
         return "unknown"
 
     name = artist_name.lower()
-    texts = " | ".join(_collect_attribution_texts(raw)).lower()
+    texts = " | ".join(_collect_attribution_texts(raw, lowercase=True))
 
     if not texts or name not in texts:
         return "unknown"
 
-    # 1) Direct maker roles should be checked before "after"
-    # because prints may contain both "printmaker" and "after design by".
-    if any(
-        w in texts
-        for w in [
-            "painter:",
-            "schilder:",
-            "artist:",
-            "maker:",
-            "printmaker:",
-            "prentmaker:",
-            "engraver:",
-            "graveur:",
-            "etcher:",
-            "designer:",
-            "draftsman:",
-            "gemaakt door",
-            "door ",
-        ]
-    ):
-        return "direct"
-
-    # 2) Attribution variants
-    if any(w in texts for w in ["attributed to", "toegeschreven aan", "zugeschrieben", "attribué à"]):
-        return "attributed"
-
-    if any(w in texts for w in ["workshop of", "atelier van", "werkplaats", "atelier de"]):
-        return "workshop"
-
-    if any(w in texts for w in ["circle of", "kring van", "school of", "navolger", "follower of", "cercle de"]):
-        return "circle"
+    # Single-word markers are matched against whole tokens (so "door" does not
+    # fire inside "outdoor"); phrases and "role:" labels stay substring checks.
+    tokens = frozenset(_WORD_RE.findall(texts))
 
-    if any(w in texts for w in ["after ", "naar ", "nach ", "d'après", "copy after", "kopie naar"]):
-        return "after"
+    for tag, phrases, words in _ATTRIBUTION_RULES:
+        if not words.isdisjoint(tokens) or any(p in texts for p in phrases):
+            return tag
 
     return "attributed"
 
@@ -862,7 +1020,8 @@ def _extract_principal_maker(raw: Dict[str, Any]) -> str:
 
     Returns a non-empty string or "Unknown artist".
     """
-    candidates: List[str] = []
+    # Insertion-ordered dict used as an ordered set (O(1) de-dup).
+    candidates: Dict[str, None] = {}
 
     def add_candidate(name: Any) -> None:
         if not isinstance(name, str):
@@ -876,8 +1035,7 @@ def _extract_principal_maker(raw: Dict[str, Any]) -> str:
         if ln in ("unknown", "unknown artist", "onbekend", "onbekende kunstenaar"):
             return
 
-        if n not in candidates:
-            candidates.append(n)
+        candidates.setdefault(n, None)
 
     def scan_agent(agent: Any) -> None:
         """
@@ -890,7 +1048,7 @@ def _extract_principal_maker(raw: Dict[str, Any]) -> str:
             return
 
         # 1) Standard identifiers / names
-        ids = agent.get("identified_by") or []
+        ids = agent.get("identified_by") or _EMPTY
         if isinstance(ids, list):
             for ident in ids:
                 if not isinstance(ident, dict):
@@ -907,7 +1065,7 @@ def _extract_principal_maker(raw: Dict[str, Any]) -> str:
                 add_candidate(val)
 
         # 3) Rijksmuseum Linked Art often stores agent display names in notation
-        notations = agent.get("notation") or []
+        notations = agent.get("notation") or _EMPTY
         if isinstance(notations, list):
             for note in notations:
                 if not isinstance(note, dict):
@@ -918,62 +1076,27 @@ def _extract_principal_maker(raw: Dict[str, Any]) -> str:
                     add_candidate(value)
 
     def scan_produced(prod: Any) -> None:
-        if isinstance(prod, dict):
-            carried = prod.get("carried_out_by") or []
-            if not isinstance(carried, list):
+        t = type(prod)
+        if t is dict:
+            carried = prod.get("carried_out_by") or _EMPTY
+            if not isinstance(carried, (list, tuple)):
                 carried = [carried]
 
             for ag in carried:
                 scan_agent(ag)
 
-            parts = prod.get("part") or []
+            parts = prod.get("part") or _EMPTY
             if isinstance(parts, list):
                 for p in parts:
                     scan_produced(p)
 
-        elif isinstance(prod, list):
+        elif t is list:
             for p in prod:
                 scan_produced(p)
 
     scan_produced(raw.get("produced_by"))
 
-    if candidates:
-        return candidates[0]
-
-    return "Unknown artist"
-
-
-def _normalize_maker_name(name: Any) -> str:
-    """
-    Normalize principal maker labels into a stable UI-friendly value.
-
-    Rules:
-      - Keep "anonymous" as "anonymous" (your preference).
-      - Convert empty/unknown-ish labels to "Unknown artist".
-    """
-    s = (name or "")
-    if not isinstance(s, str):
-        return "Unknown artist"
-
-    s = s.strip()
-    if not s:
-        return "Unknown artist"
-
-    low = s.lower()
-
-    unknown_tokens = {
-        "unknown", "unknown artist",
-        "onbekend", "onbekende kunstenaar",
-        "n/a", "not specified", "niet vermeld"
-    }
-    if low in unknown_tokens:
-        return "Unknown artist"
-
-    anonymous_tokens = {"anonymous", "anoniem"}
-    if low in anonymous_tokens:
-        return "anonymous"
-
-    return s
+    return next(iter(candidates), "Unknown artist")
 
 
 # ============================================================
@@ -1039,7 +1162,7 @@ def _map_linked_art_to_legacy_dict(raw: Dict[str, Any]) -> Dict[str, Any]:
 
     # 2) Title (prefer a human-readable label over inventory numbers)
     title = "Untitled"
-    identified_by = raw.get("identified_by") or []
+    identified_by = raw.get("identified_by") or _EMPTY
 
     title_candidates: List[str] = []
     inventory_candidates: List[str] = []
@@ -1084,7 +1207,7 @@ def _map_linked_art_to_legacy_dict(raw: Dict[str, Any]) -> Dict[str, Any]:
             object_number = obj_from_url.strip()
 
     # Fallback: sometimes the canonical inventory number appears as an identifier
-    if not any(object_number.startswith(p) for p in CANONICAL_PREFIXES) and isinstance(identified_by, list):
+    if not object_number.startswith(CANONICAL_PREFIXES) and isinstance(identified_by, list):
         for ident in identified_by:
             if not isinstance(ident, dict):
                 continue
@@ -1099,7 +1222,7 @@ def _map_linked_art_to_legacy_dict(raw: Dict[str, Any]) -> Dict[str, Any]:
     #   1) https://www.rijksmuseum.nl/en/collection/<object_number>
     #   2) public_url
     #   3) pid_url
-    if any(object_number.startswith(p) for p in CANONICAL_PREFIXES):
+    if object_number.startswith(CANONICAL_PREFIXES):
         stable_web_url = f"https://www.rijksmuseum.nl/en/collection/{object_number}"
     elif public_url:
         stable_web_url = public_url
@@ -1110,52 +1233,48 @@ def _map_linked_art_to_legacy_dict(raw: Dict[str, Any]) -> Dict[str, Any]:
 
     # 5) Principal maker (JSON first, then fall back to public HTML if still unknown)
 
+    # Always normalized through _normalize_maker_label, so "Unknown artist"
+    # is the single placeholder value to compare against below.
     principal_or_first_maker = _normalize_maker_label(_extract_principal_maker(raw))
     creator_role: Optional[str] = None
     author_note: Optional[str] = None
 
-    # Local HTML cache so we hit the public page at most once per object
-    html_cache: Optional[str] = None
+    # Facts from the public object page, looked up lazily and at most once
+    # per mapped object (the page HTML itself is cached).
+    page_facts: Optional[_PublicPageFacts] = None
 
-    def get_object_html() -> Optional[str]:
-        """Lazy, cached fetch of the public object HTML (if available)."""
-        nonlocal html_cache
-        if html_cache is not None:
-            return html_cache
-        if not stable_web_url or "rijksmuseum.nl" not in stable_web_url:
-            html_cache = None
-            return html_cache
-        html_cache = _fetch_public_object_html(stable_web_url, timeout=DETAIL_TIMEOUT)
-        return html_cache
+    def get_page_facts() -> _PublicPageFacts:
+        """Lazy lookup of the public object page facts (if available)."""
+        nonlocal page_facts
+        if page_facts is None:
+            if not stable_web_url or "rijksmuseum.nl" not in stable_web_url:
+                page_facts = _NO_PUBLIC_PAGE_FACTS
+            else:
+                page_facts = _public_page_facts(stable_web_url)
+        return page_facts
 
     # 5a) Try to improve artist name from HTML only if JSON-based name is still unknown
-    if ENABLE_HTML_FALLBACK and _normalize_maker_name(principal_or_first_maker) == "Unknown artist":
-        html = get_object_html()
-
-        if html:
-            html_artist = _extract_artist_from_object_html(html)
+    if ENABLE_HTML_FALLBACK and principal_or_first_maker == "Unknown artist":
+        html_artist = get_page_facts().artist
 
-            if html_artist:
-                principal_or_first_maker = _normalize_maker_label(html_artist)
+        if html_artist:
+            principal_or_first_maker = _normalize_maker_label(html_artist)
 
     # 5b) Optional: try to extract (creator name, role) from HTML.
     # This is useful for research classification, but expensive if done for every artwork.
     if ENABLE_HTML_FALLBACK and (
             ENABLE_HTML_ROLE_LOOKUP
-            or _normalize_maker_name(principal_or_first_maker) == "Unknown artist"
+            or principal_or_first_maker == "Unknown artist"
     ):
-        html = get_object_html()
+        facts = get_page_facts()
 
-        if html:
-            creator_name_html, creator_role_html = _extract_creator_and_role_from_object_html(html)
+        # Use the role for work-kind classification only when enabled
+        if ENABLE_HTML_ROLE_LOOKUP and facts.creator_role:
+            creator_role = facts.creator_role
 
-            # Use the role for work-kind classification only when enabled
-            if ENABLE_HTML_ROLE_LOOKUP and creator_role_html:
-                creator_role = creator_role_html
-
-            # If the principal maker is still unknown, use the HTML name as fallback
-            if _normalize_maker_name(principal_or_first_maker) == "Unknown artist" and creator_name_html:
-                principal_or_first_maker = _normalize_maker_label(creator_name_html)
+        # If the principal maker is still unknown, use the HTML name as fallback
+        if principal_or_first_maker == "Unknown artist" and facts.creator_name:
+            principal_or_first_maker = _normalize_maker_label(facts.creator_name)
 
     # If, after all attempts, the author is still unknown, keep a note for the UI
     if principal_or_first_maker == "Unknown artist" and not author_note:
@@ -1174,8 +1293,8 @@ def _map_linked_art_to_legacy_dict(raw: Dict[str, Any]) -> Dict[str, Any]:
         bob = timespan.get("begin_of_the_begin")
         eoe = timespan.get("end_of_the_end")
         for candidate in (bob, eoe):
-            if isinstance(candidate, str) and len(candidate) >= 4 and candidate[:4].isdigit():
-                year = int(candidate[:4])
+            year = _parse_year(candidate)
+            if year is not None:
                 presenting_date = candidate[:10]
                 break
 
@@ -1203,10 +1322,7 @@ def _map_linked_art_to_legacy_dict(raw: Dict[str, Any]) -> Dict[str, Any]:
     public_page_image_status = "no_public_image"
 
     if ENABLE_HTML_FALLBACK and stable_web_url and "rijksmuseum.nl" in stable_web_url:
-        html = get_object_html()
-
-        if html:
-            public_page_image_status = _detect_image_status_from_object_html(html)
+        public_page_image_status = get_page_facts().image_status
 
     if RESOLVE_IMAGES_DURING_SEARCH:
         if public_page_image_status == "copyright":
@@ -1262,7 +1378,7 @@ def resolve_objectnumber_to_pid(session: requests.Session, object_number: str) -
             raise RijksAPIError(f"Search API error ({resp.status_code}) via {field}: {resp.text[:200]}")
 
         data = resp.json()
-        items = data.get("orderedItems") or data.get("items") or []
+        items = data.get("orderedItems") or data.get("items") or _EMPTY
         if items:
             pid = items[0].get("id")
             if isinstance(pid, str) and pid.strip():
@@ -1271,6 +1387,18 @@ def resolve_objectnumber_to_pid(session: requests.Session, object_number: str) -
     raise RijksAPIError(f"Could not resolve objectNumber={object_number} to PID.")
 
 
+def load_metadata_by_objectnumber(object_number: str) -> Dict[str, Any]:
+    """
+    Uncached variant of fetch_metadata_by_objectnumber.
+
+    For background threads, which have no Streamlit script context and so
+    should not call st.cache_data functions.
+    """
+    session = _get_session()
+    pid = resolve_objectnumber_to_pid(session, object_number)
+    return _fetch_linked_art_json(session, pid)
+
+
 @st.cache_data(show_spinner=False, ttl=7 * 24 * 3600)
 def fetch_metadata_by_objectnumber(object_number: str) -> Dict[str, Any]:
     """Fetch raw Linked Art JSON for a given objectNumber (SK-...)."""
@@ -1286,13 +1414,7 @@ def extract_year(dating: Dict[str, Any]) -> Optional[int]:
     y = dating.get("year")
     if isinstance(y, int):
         return y
-    pd = dating.get("presentingDate")
-    if isinstance(pd, str) and pd[:4].isdigit():
-        try:
-            return int(pd[:4])
-        except Exception:
-            return None
-    return None
+    return _parse_year(dating.get("presentingDate"))
 
 
 def get_best_image_url(art: Dict[str, Any]) -> Optional[str]:
@@ -1305,6 +1427,55 @@ def get_best_image_url(art: Dict[str, Any]) -> Optional[str]:
     return None
 
 
+def get_thumbnail_url(url: str, size: int = THUMBNAIL_SIZE) -> str:
+    """
+    Rewrite an image URL to request a thumbnail that fits in `size` x `size`.
+
+    - IIIF: replace the size segment with `!size,size` (best fit).
+    - Google-hosted `=sN` URLs: set `=s<size>`.
+    - Anything else is returned unchanged.
+    """
+    thumb, n = _IIIF_SIZE_RE.subn(rf"/full/!{size},{size}/\1", url)
+    if n:
+        return thumb
+    return _GOOGLE_SIZE_RE.sub(f"=s{size}", url)
+
+
+def _local_sort_key(sort: str):
+    """
+    Return the key function for the local sort mode.
+
+    The mode is resolved once per search (not per item), and `list.sort(key=...)`
+    decorates each item exactly once, so the casefolded artist/title strings and
+    the year are computed a single time per artwork. The year is only extracted
+    for the chronological modes.
+    """
+
+    def artist_title(art: Dict[str, Any]) -> Tuple[str, str]:
+        return (
+            (art.get("principalOrFirstMaker") or "").casefold(),
+            (art.get("title") or "").casefold(),
+        )
+
+    def year_of(art: Dict[str, Any]) -> int:
+        return extract_year(art.get("dating") or {}) or 10 ** 9
+
+    if sort == "title":
+        def key(art: Dict[str, Any]):
+            artist, title = artist_title(art)
+            return (title, artist)
+        return key
+
+    if sort == "chronologic":
+        return lambda art: (year_of(art), *artist_title(art))
+
+    if sort == "achronologic":
+        return lambda art: (-year_of(art), *artist_title(art))
+
+    # "relevance", "artist" and unknown modes
+    return artist_title
+
+
 def search_artworks(
         query: str,
         object_type: Optional[str] = None,
@@ -1350,57 +1521,25 @@ def search_artworks(
             print(f"[PERF] total search_artworks: {time.perf_counter() - t0:.2f}s")
         return [], 0
 
-    raw_objects: List[Dict[str, Any]] = []
-
     t_fetch = time.perf_counter()
 
-    with ThreadPoolExecutor(max_workers=4) as ex:
-        futures = {ex.submit(_fetch_linked_art_json_cached, pid): pid for pid in pids}
-        for fut in as_completed(futures):
-            pid = futures[fut]
-            try:
-                raw_objects.append(fut.result())
-            except RijksAPIError as exc:
-                print(f"[rijks_api] Warning: failed to fetch {pid}: {exc}")
-
-    if DEBUG_PERFORMANCE:
-        print(
-            f"[PERF] fetch linked art: {time.perf_counter() - t_fetch:.2f}s "
-            f"| objects={len(raw_objects)}"
-        )
-
-    mapped: List[Dict[str, Any]] = []
-
-    t_map = time.perf_counter()
+    # Pipeline: each worker resolves one PID and maps it right away, so
+    # mapping (including its own image/HTML lookups) overlaps with the
+    # remaining resolver requests instead of waiting for all of them.
+    # The order does not matter here: the results are re-sorted locally
+    # below for every mode ("relevance" included, by artist/title).
+    with ThreadPoolExecutor(max_workers=min(16, len(pids))) as ex:
+        results = list(ex.map(lambda pid: _fetch_and_map(session, pid), pids))
 
-    for raw in raw_objects:
-        try:
-            mapped.append(_map_linked_art_to_legacy_dict(raw))
-        except Exception as exc:
-            print(f"[rijks_api] Warning: failed to map object: {exc}")
+    mapped: List[Dict[str, Any]] = [art for art in results if art is not None]
 
     if DEBUG_PERFORMANCE:
         print(
-            f"[PERF] map objects: {time.perf_counter() - t_map:.2f}s "
+            f"[PERF] fetch + map linked art: {time.perf_counter() - t_fetch:.2f}s "
             f"| mapped={len(mapped)}"
         )
 
-    def _sort_key(art: Dict[str, Any]):
-        artist = (art.get("principalOrFirstMaker") or "").lower()
-        title = (art.get("title") or "").lower()
-        year = extract_year(art.get("dating") or {}) or 10 ** 9
-
-        if norm.sort in ("relevance", "artist"):
-            return (artist, title)
-        if norm.sort == "title":
-            return (title, artist)
-        if norm.sort == "chronologic":
-            return (year, artist, title)
-        if norm.sort == "achronologic":
-            return (-year, artist, title)
-        return (artist, title)
-
-    mapped.sort(key=_sort_key)
+    mapped.sort(key=_local_sort_key(norm.sort))
 
     total = len(mapped)
     start = (norm.page - 1) * norm.page_size
@@ -1,13 +1,29 @@
+import re
+from html import escape
+
 import streamlit as st
 
 
-import streamlit as st
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_SPACE_RE = re.compile(r"\s*([{};])\s*")
 
 
-def inject_global_css() -> None:
-    """CSS base compartilhado por todas as páginas (dark mode + layout)."""
-    st.markdown(
-        """
+def minify_css(css: str) -> str:
+    """
+    Remove comentários e espaços redundantes de um bloco `<style>`.
+
+    Conservador: só encosta espaços em `{`, `}` e `;` (nunca em `:` ou `>`,
+    que mudam o sentido de seletores).
+    """
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    return _CSS_PUNCT_SPACE_RE.sub(r"\1", css).strip()
+
+
+# CSS base compartilhado por todas as páginas (dark mode + layout).
+# Constante de módulo: montada (e minificada) uma única vez no import.
+_GLOBAL_CSS_RAW = """
         <style>
         /* ============================
            Painéis genéricos e pílulas
@@ -37,12 +53,9 @@ def inject_global_css() -> None:
         .rijks-pill strong { color: #ff9900; }
 
         /* ============================
-           Layout e cores globais
+           Layout global
+           (paleta: .streamlit/config.toml [theme])
         ============================ */
-        .stApp {
-            background-color: #111111;
-            color: #f5f5f5;
-        }
 
         /* Área central de conteúdo */
         div.block-container {
@@ -66,11 +79,6 @@ def inject_global_css() -> None:
             margin-top: 0.5rem;
         }
 
-        /* Sidebar em dark mode */
-        section[data-testid="stSidebar"] {
-            background-color: #181818 !important;
-        }
-
         /* ============================
            Tipografia básica
         ============================ */
@@ -140,35 +148,52 @@ def inject_global_css() -> None:
         }
         
         </style>
-        """,
-        unsafe_allow_html=True,
-    )
+        """
+_GLOBAL_CSS = minify_css(_GLOBAL_CSS_RAW)
 
-def show_page_intro(title: str, bullets: list[str]) -> None:
-    """Bloco padrão de introdução no topo de cada página."""
-    items_html = "".join(f"<li>{b}</li>" for b in bullets)
-    st.markdown(
-        f"""
+
+def inject_global_css(page_css: str = "") -> None:
+    """
+    CSS base compartilhado por todas as páginas (dark mode + layout).
+
+    Precisa ser emitido a cada rerun: o Streamlit remove os elementos que
+    não são reenviados, então pular a injeção apagaria o estilo.
+    Usa `st.html` (só HTML, sem passar pelo parser de Markdown); um bloco
+    apenas com `<style>` não ocupa espaço no layout.
+
+    `page_css` (bloco `<style>` da página, já montado) vai no mesmo elemento,
+    evitando uma segunda mensagem de CSS por rerun.
+    """
+    st.html(_GLOBAL_CSS + page_css)
+
+
+def _intro_html(title: str, bullets: list[str]) -> str:
+    """HTML do bloco de introdução (título e itens escapados)."""
+    items_html = "".join(f"<li>{escape(b, quote=False)}</li>" for b in bullets)
+    return f"""
         <div class="page-intro-wrapper">
-            <p class="page-intro-title">{title}</p>
+            <p class="page-intro-title">{escape(title, quote=False)}</p>
             <ul class="page-intro-list">
                 {items_html}
             </ul>
         </div>
-        """,
-        unsafe_allow_html=True,
-    )
+        """
 
 
-def show_global_footer() -> None:
-    """Rodapé padrão para todas as páginas."""
-    st.markdown(
-        """
+def show_page_intro(title: str, bullets: list[str]) -> None:
+    """Bloco padrão de introdução no topo de cada página."""
+    st.html(_intro_html(title, bullets))
+
+
+_FOOTER_HTML = """
         <div class="rijks-footer">
             Open Collection Research Explorer — independent prototype created for study & research purposes.<br>
             Collection data and images are sourced from Rijksmuseum Data Services / Rijksmuseum Collection Online.<br>
             Not affiliated with, endorsed by, or sponsored by the Rijksmuseum.
         </div>
-        """,
-        unsafe_allow_html=True,
-    )
\ No newline at end of file
+        """
+
+
+def show_global_footer() -> None:
+    """Rodapé padrão para todas as páginas."""
+    st.html(_FOOTER_HTML)
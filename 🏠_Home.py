@@ -14,26 +14,46 @@ This page provides:
 
 from __future__ import annotations
 
-import json
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from html import escape
 from math import ceil
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
+import orjson
 import streamlit as st
 
 from app_paths import FAV_FILE, NOTES_FILE, HERO_IMAGE_PATH
-from analytics import track_event, track_event_once
+from favorites_store import (
+    append_favorite_op,
+    append_favorite_ops,
+    replay_journal,
+    snapshot_mtime_ns,
+    write_snapshot,
+)
+from analytics import track_event, track_event_once, track_events, was_tracked
 from rijks_api import (
     search_artworks,
     extract_year,
     get_best_image_url,
+    get_thumbnail_url,
     probe_image_url,
     fetch_metadata_by_objectnumber,
-    RijksAPIError,
+    load_metadata_by_objectnumber,
+)
+from ui_theme import (
+    inject_global_css,
+    minify_css,
+    show_global_footer,
+    show_page_intro,
 )
-from ui_theme import inject_global_css, show_global_footer, show_page_intro
 
 # ============================================================
 # Page config
+# (exactly once per run, and before any other Streamlit command)
 # ============================================================
 st.set_page_config(
     page_title="Open Collection Research Explorer",
@@ -41,38 +61,23 @@ st.set_page_config(
     layout="wide",
 )
 
-# Apply global dark theme & layout
-inject_global_css()
-
 # ============================================================
 # Styling
 # ============================================================
-def inject_custom_css() -> None:
-    """Inject dark theme and card styling for the Explorer page."""
-    st.markdown(
+@st.cache_resource(show_spinner=False)
+def _explorer_css() -> str:
+    """Explorer CSS payload, built (and minified) once per process."""
+    return minify_css(
         """
         <style>
-        .stApp { background-color: #111111; color: #f5f5f5; }
+        /* Palette (background, text, sidebar) comes from .streamlit/config.toml;
+           links and footer come from ui_theme.inject_global_css. */
         div.block-container {
             max-width: 1200px;
             padding-top: 2.5rem;
             padding-bottom: 3rem;
         }
 
-        section[data-testid="stSidebar"] { background-color: #181818 !important; }
-        section[data-testid="stSidebar"] h1,
-        section[data-testid="stSidebar"] h2,
-        section[data-testid="stSidebar"] h3,
-        section[data-testid="stSidebar"] label { color: #f5f5f5 !important; }
-
-        div[data-testid="stMarkdownContainer"] a {
-            color: #ff9900 !important;
-            text-decoration: none;
-        }
-        div[data-testid="stMarkdownContainer"] a:hover {
-            text-decoration: underline;
-        }
-
         .rijks-hero {
             border-radius: 14px;
             overflow: hidden;
@@ -120,6 +125,11 @@ def inject_custom_css() -> None:
             margin-bottom: 0.25rem;
         }
 
+        .rijks-card-meta {
+            font-size: 0.85rem;
+            color: #c7c7c7;
+        }
+
         .rijks-badge-row { margin-top: 0.15rem; margin-bottom: 0.35rem; }
         .rijks-badge {
             display: inline-block;
@@ -152,22 +162,17 @@ def inject_custom_css() -> None:
             border: 1px dashed #444444;
         }
 
-        .rijks-footer {
-            margin-top: 2.5rem;
-            padding-top: 0.75rem;
-            border-top: 1px solid #262626;
-            font-size: 0.8rem;
-            color: #aaaaaa;
-            text-align: center;
-        }
-
         .stButton > button { border-radius: 999px; }
         </style>
-        """,
-        unsafe_allow_html=True,
+        """
     )
 
 
+# Apply global dark theme & layout plus the Explorer card styling, as one
+# element (re-emitted every rerun: Streamlit drops elements a rerun skips)
+inject_global_css(_explorer_css())
+
+
 # Intro block (consistent with other pages)
 show_page_intro(
     "Search and browse public collection data made available through Rijksmuseum Data Services and Linked Art metadata.",
@@ -180,188 +185,328 @@ show_page_intro(
     ],
 )
 
-# Apply page-specific CSS
-inject_custom_css()
-
 
 # ============================================================
 # Local persistence: favorites + notes
 # ============================================================
-@st.cache_data(show_spinner=False)
-def _read_json_file(path_str: str) -> dict:
-    """Read JSON file safely (returns dict or {})."""
+# Two files (favorites, notes): room for the current and the previous
+# version of each; older mtimes are evicted instead of piling up
+@st.cache_data(show_spinner=False, max_entries=4)
+def _read_json_file(path_str: str, mtime_ns: int) -> dict:
+    """
+    Read JSON file safely (returns dict or {}).
+
+    Keyed on the file's mtime, so a save naturally invalidates the entry.
+    cache_data hands every caller its own deep copy, so sessions can mutate
+    the nested art dicts without touching each other's data.
+    """
     try:
-        with open(path_str, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(Path(path_str).read_bytes())
         return data if isinstance(data, dict) else {}
     except Exception:
         return {}
 
 
-def load_favorites() -> None:
-    """Load favorites into session_state from disk."""
-    if "favorites" not in st.session_state:
-        st.session_state["favorites"] = (
-            _read_json_file(str(FAV_FILE)) if FAV_FILE.exists() else {}
-        )
+def _mtime_ns(path: Path) -> int:
+    """File mtime in ns, 0 when missing (one stat call instead of exists + stat)."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
 
 
-def load_notes() -> None:
-    """Load notes into session_state from disk."""
-    if "notes" not in st.session_state:
-        st.session_state["notes"] = (
-            _read_json_file(str(NOTES_FILE)) if NOTES_FILE.exists() else {}
-        )
+def _load_json_dict(path: Path) -> dict:
+    """Session-private copy of a JSON dict file ({} when missing)."""
+    mtime = _mtime_ns(path)
+    if not mtime:
+        return {}
+    return _read_json_file(str(path), mtime)
+
+
+def _session_json_dict(key: str, path: Path) -> dict:
+    """Return session_state[key], loading it from `path` on first access."""
+    data = st.session_state.get(key)
+    if data is None:
+        data = _load_json_dict(path)
+        st.session_state[key] = data
+    return data
+
+
+def get_favorites() -> Dict[str, Any]:
+    """
+    Favorites dict of this session (loaded from disk on first access).
+
+    Snapshot from the mtime-keyed cache, plus the journal of single toggles
+    recorded on top of it (see favorites_store).
+
+    The dict is also the membership index: `obj in favorites` and
+    `len(favorites)` are hash lookups on the keys, so no separate id set is
+    kept in sync with it (the art payloads are shared, not copied).
+    """
+    favorites = st.session_state.get("favorites")
+    if favorites is None:
+        base = snapshot_mtime_ns()
+        snapshot = _read_json_file(str(FAV_FILE), base) if base else {}
+        # Interned keys: shared with the result dicts' objectNumbers
+        favorites = {sys.intern(k): v for k, v in snapshot.items()}
+        replay_journal(favorites, base)
+        st.session_state["favorites"] = favorites
+    return favorites
+
+
+def get_notes() -> Dict[str, str]:
+    """Notes dict of this session (loaded from disk on first access)."""
+    return _session_json_dict("notes", NOTES_FILE)
+
+
+def get_noted_ids() -> FrozenSet[str]:
+    """
+    objectNumbers with a non-blank note in this session.
+
+    Rebuilt only when notes.json changes on disk (My Selection persists every
+    note edit), so the card loop does a single set lookup per artwork.
+    """
+    mtime = _mtime_ns(NOTES_FILE)
+    cached = st.session_state.get("_noted_ids")
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    noted = frozenset(
+        k for k, v in get_notes().items() if isinstance(v, str) and v.strip()
+    )
+    st.session_state["_noted_ids"] = (mtime, noted)
+    return noted
 
 
 def save_favorites() -> None:
-    """Persist favorites to disk and clear JSON cache."""
-    try:
-        with open(FAV_FILE, "w", encoding="utf-8") as f:
-            json.dump(st.session_state["favorites"], f, ensure_ascii=False, indent=2)
-        _read_json_file.clear()
-    except Exception:
-        # Do not break UI if saving fails
-        pass
+    """
+    Persist the full favorites dict (atomic snapshot; clears the journal).
+
+    Only used to compact the journal; selection changes themselves are
+    appended to the journal (see favorites_store).
+    """
+    write_snapshot(st.session_state["favorites"])
+
+
+def mark_favorites_dirty() -> None:
+    """Request a snapshot write at the end of the current run."""
+    st.session_state["favorites_dirty"] = True
+
+
+def flush_favorites() -> None:
+    """Write the snapshot once if this run (or an interrupted one) asked for it."""
+    if st.session_state.pop("favorites_dirty", False):
+        save_favorites()
 
 
 # ============================================================
 # Filtering helpers
 # ============================================================
-def passes_authorship_scope(art: Dict[str, Any], auth_scope: str) -> bool:
+# Authorship scope label prefix -> allowed attribution tags (None = no filter).
+# Order matters: "Direct + Attributed + Circle" must match before "Direct + Attributed".
+_SCOPE_TAGS: Dict[str, Optional[FrozenSet[str]]] = {
+    "Direct only": frozenset({"direct", "unknown"}),
+    "Direct + Attributed + Circle": frozenset({"direct", "attributed", "circle", "unknown"}),
+    "Direct + Attributed": frozenset({"direct", "attributed", "unknown"}),
+    "Include workshop": frozenset(
+        {"direct", "attributed", "workshop", "circle", "after", "unknown"}
+    ),
+    "Show all": None,
+}
+
+
+def _resolve_scope(auth_scope: str) -> Optional[FrozenSet[str]]:
     """
-    Filter artworks by authorship scope.
+    Resolve a scope label to its allowed tags once per filter pass.
 
     Notes:
     - Many objects come with `_attribution="unknown"`.
     - To avoid hiding everything, most scopes keep "unknown".
     """
-    tag = (art.get("_attribution") or "unknown").lower()
+    # Fallback (unknown label): do not filter out
+    return next(
+        (tags for prefix, tags in _SCOPE_TAGS.items() if auth_scope.startswith(prefix)),
+        None,
+    )
 
-    if auth_scope.startswith("Direct only"):
-        return tag in ("direct", "unknown")
 
-    if auth_scope.startswith("Direct + Attributed + Circle"):
-        return tag in ("direct", "attributed", "circle", "unknown")
+# Fields added by annotate_results: search-time only, never persisted
+_DERIVED_KEYS = frozenset(
+    {"_attribution_l", "_year", "_img_url", "_materials_l", "_places_l"}
+)
 
-    if auth_scope.startswith("Direct + Attributed"):
-        return tag in ("direct", "attributed", "unknown")
 
-    if auth_scope.startswith("Include workshop"):
-        return tag in ("direct", "attributed", "workshop", "circle", "after", "unknown")
+def annotate_results(results: List[Dict[str, Any]]) -> None:
+    """
+    Derive per-artwork values once per fetch (in place).
 
-    if auth_scope.startswith("Show all"):
-        return True
+    Filters and cards read these fields instead of re-parsing the artwork
+    on every pass/rerun. They are stripped again before an artwork goes
+    into favorites (see `favorite_entry`).
+    """
+    for art in results:
+        art["_attribution_l"] = (art.get("_attribution") or "unknown").lower()
+        art["_year"] = extract_year(art.get("dating") or {})
+        art["_img_url"] = get_best_image_url(art)
+        art["_materials_l"] = ", ".join(art.get("materials") or []).lower()
+        art["_places_l"] = ", ".join(art.get("productionPlaces") or []).lower()
 
-    # Fallback: do not filter out
-    return True
 
+def favorite_entry(art: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a result artwork for favorites, without the derived fields."""
+    return {k: v for k, v in art.items() if k not in _DERIVED_KEYS}
 
-def passes_metadata_filters(
-    art: Dict[str, Any],
+
+@lru_cache(maxsize=32)
+def _make_predicates(
+    auth_scope: str,
+    year_min: int,
+    year_max: int,
+    material_l: str,
+    place_l: str,
+) -> Tuple[Callable[[Dict[str, Any]], bool], ...]:
+    """
+    Build the predicates for one filter setting, leaving out inactive ones.
+
+    Ordered cheapest / most selective first. Cached on the (lowercased)
+    filter values, which rarely change within a session.
+    """
+    # Year range (unknown year: keep)
+    predicates: List[Callable[[Dict[str, Any]], bool]] = [
+        lambda art: art["_year"] is None or year_min <= art["_year"] <= year_max
+    ]
+
+    # Authorship scope: frozenset membership on the precomputed tag
+    allowed = _resolve_scope(auth_scope)
+    if allowed is not None:
+        predicates.append(lambda art: art["_attribution_l"] in allowed)
+
+    # Substring tests only when a needle is set
+    if material_l:
+        predicates.append(lambda art: material_l in art["_materials_l"])
+    if place_l:
+        predicates.append(lambda art: place_l in art["_places_l"])
+
+    return tuple(predicates)
+
+
+def intern_object_numbers(results: List[Dict[str, Any]]) -> None:
+    """
+    Intern each artwork's objectNumber (in place).
+
+    The same ID string is then shared by the result dicts, the favorites keys
+    and every lookup made with them, so dict probes can match on identity.
+    Runs on every fresh result list: st.cache_data hands out unpickled
+    copies, which carry new string objects.
+    """
+    for art in results:
+        obj_num = art.get("objectNumber")
+        if isinstance(obj_num, str) and obj_num:
+            art["objectNumber"] = sys.intern(obj_num)
+
+
+def filter_results(
+    results: List[Dict[str, Any]],
+    auth_scope: str,
     year_min: int,
     year_max: int,
     material_filter: str,
     place_filter: str,
-) -> bool:
-    """Local post-filters applied after results are fetched."""
-    dating = art.get("dating") or {}
-    year = extract_year(dating)
+) -> List[Dict[str, Any]]:
+    """
+    Local post-filters applied after results are fetched.
+
+    Chains one lazy `filter` per active predicate (see `_make_predicates`),
+    so each artwork still stops at the first failing test and inactive
+    filters cost nothing. Predicates read the fields precomputed per fetch
+    (see `annotate_results`).
+    """
+    kept: Iterable[Dict[str, Any]] = results
+    for predicate in _make_predicates(
+        auth_scope, year_min, year_max, material_filter.lower(), place_filter.lower()
+    ):
+        kept = filter(predicate, kept)
+    return list(kept)
+
+
+_FAV_BADGE_HTML = '<span class="rijks-badge rijks-badge-primary">⭐ In my selection</span>'
+_NOTES_BADGE_HTML = '<span class="rijks-badge rijks-badge-secondary">📝 Notes</span>'
+
+# Leading card badges for each (in selection, has notes) combination
+_STATE_BADGES_HTML: Dict[Tuple[bool, bool], Tuple[str, ...]] = {
+    (False, False): (),
+    (True, False): (_FAV_BADGE_HTML,),
+    (False, True): (_NOTES_BADGE_HTML,),
+    (True, True): (_FAV_BADGE_HTML, _NOTES_BADGE_HTML),
+}
 
-    if year is not None and (year < year_min or year > year_max):
-        return False
+_ATTR_BADGE_HTML: Dict[str, str] = {
+    "direct": '<span class="rijks-badge">✅ Direct</span>',
+    "attributed": '<span class="rijks-badge">🟡 Attributed</span>',
+    "workshop": '<span class="rijks-badge">🟠 Workshop</span>',
+    "circle": '<span class="rijks-badge">🔵 Circle/School</span>',
+    "after": '<span class="rijks-badge">🟣 After</span>',
+    "unknown": '<span class="rijks-badge">⚪ Unknown</span>',
+}
 
-    if material_filter:
-        materials = art.get("materials") or []
-        if material_filter.lower() not in ", ".join(materials).lower():
-            return False
+_IMG_BADGE_HTML: Dict[str, str] = {
+    "copyright": '<span class="rijks-badge rijks-badge-secondary">🔒 Copyright</span>',
+    "page_missing": '<span class="rijks-badge rijks-badge-secondary">⚠️ Page missing</span>',
+    "broken": '<span class="rijks-badge rijks-badge-secondary">⚠️ Image unavailable</span>',
+    "no_public_image": '<span class="rijks-badge rijks-badge-secondary">🚫 No public image</span>',
+}
 
-    if place_filter:
-        places = art.get("productionPlaces") or []
-        if place_filter.lower() not in ", ".join(places).lower():
-            return False
+_KIND_BADGE_HTML: Dict[str, str] = {
+    "original": '<span class="rijks-badge rijks-badge-secondary">🖼️ Original work</span>',
+    "reproduction": '<span class="rijks-badge rijks-badge-secondary">🎞️ Reproduction</span>',
+    "photograph": '<span class="rijks-badge rijks-badge-secondary">📷 Photograph</span>',
+}
+
+_NO_IMAGE_MSG_HTML: Dict[str, str] = {
+    "copyright": (
+        '<div class="rijks-no-image-msg">'
+        "This image cannot be displayed here due to copyright restrictions.<br>"
+        "You can try opening it on the Rijksmuseum website, but it may also be unavailable there."
+        "</div>"
+    ),
+    "page_missing": (
+        '<div class="rijks-no-image-msg">'
+        "The public Rijksmuseum page for this object appears to be unavailable (page not found).<br>"
+        "The object may have moved or the link may be outdated."
+        "</div>"
+    ),
+    "broken": (
+        '<div class="rijks-no-image-msg">'
+        "The image for this artwork could not be loaded at this moment.<br>"
+        "You can still open it on the Rijksmuseum website using the link below."
+        "</div>"
+    ),
+}
 
-    return True
+# Default fallback
+_NO_IMAGE_MSG_DEFAULT = (
+    '<div class="rijks-no-image-msg">'
+    "No public image is available for this artwork via the current mapping.<br>"
+    "You can still open it on the Rijksmuseum website using the link below."
+    "</div>"
+)
 
 
 def attribution_badge_html(art: Dict[str, Any]) -> str:
     """Return HTML badge for attribution label."""
-    attr = (art.get("_attribution") or "unknown").lower()
-    label_map = {
-        "direct": "✅ Direct",
-        "attributed": "🟡 Attributed",
-        "workshop": "🟠 Workshop",
-        "circle": "🔵 Circle/School",
-        "after": "🟣 After",
-        "unknown": "⚪ Unknown",
-    }
-    label = label_map.get(attr, "⚪ Unknown")
-    return f'<span class="rijks-badge">{label}</span>'
-
-
-def render_image_message(img_status: str) -> None:
-    """Show a small helper message when the image cannot be displayed."""
-
-    if img_status == "copyright":
-        st.markdown(
-            """
-            <div class="rijks-no-image-msg">
-            This image cannot be displayed here due to copyright restrictions.<br>
-            You can try opening it on the Rijksmuseum website, but it may also be unavailable there.
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-        return
-
-    if img_status == "page_missing":
-        st.markdown(
-            """
-            <div class="rijks-no-image-msg">
-            The public Rijksmuseum page for this object appears to be unavailable (page not found).<br>
-            The object may have moved or the link may be outdated.
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-        return
-
-    if img_status == "broken":
-        st.markdown(
-            """
-            <div class="rijks-no-image-msg">
-            The image for this artwork could not be loaded at this moment.<br>
-            You can still open it on the Rijksmuseum website using the link below.
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-        return
+    # Lowercased tag precomputed per fetch (annotate_results); raw field otherwise
+    attr = art.get("_attribution_l") or (art.get("_attribution") or "unknown").lower()
+    return _ATTR_BADGE_HTML.get(attr, _ATTR_BADGE_HTML["unknown"])
 
-    # Default fallback
-    st.markdown(
-        """
-        <div class="rijks-no-image-msg">
-        No public image is available for this artwork via the current mapping.<br>
-        You can still open it on the Rijksmuseum website using the link below.
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+
+def image_message_html(img_status: str) -> str:
+    """Return a small helper message for when the image cannot be displayed."""
+    return _NO_IMAGE_MSG_HTML.get(img_status, _NO_IMAGE_MSG_DEFAULT)
 
 
 def image_status_badge_html(img_status: str) -> str:
     """Return an additional badge for special image status."""
-    img_status = (img_status or "").lower()
-    if img_status == "copyright":
-        return '<span class="rijks-badge rijks-badge-secondary">🔒 Copyright</span>'
-    if img_status == "page_missing":
-        return '<span class="rijks-badge rijks-badge-secondary">⚠️ Page missing</span>'
-    if img_status == "broken":
-        return '<span class="rijks-badge rijks-badge-secondary">⚠️ Image unavailable</span>'
-    if img_status == "no_public_image":
-        return '<span class="rijks-badge rijks-badge-secondary">🚫 No public image</span>'
-    return ""
+    return _IMG_BADGE_HTML.get((img_status or "").lower(), "")
+
 
 def work_kind_badge_html(kind: str) -> str:
     """
@@ -369,42 +514,75 @@ def work_kind_badge_html(kind: str) -> str:
     (original work, reproduction or photograph).
 
     The value comes from the `_work_kind` field mapped in `rijks_api.py`.
+    For "unknown" or anything else, no badge is shown.
     """
-    k = (kind or "").lower()
-
-    if k == "original":
-        return '<span class="rijks-badge rijks-badge-secondary">🖼️ Original work</span>'
-    if k == "reproduction":
-        return '<span class="rijks-badge rijks-badge-secondary">🎞️ Reproduction</span>'
-    if k == "photograph":
-        return '<span class="rijks-badge rijks-badge-secondary">📷 Photograph</span>'
+    return _KIND_BADGE_HTML.get((kind or "").lower(), "")
+
+
+def render_card_html(
+    title: str,
+    maker: str,
+    img_url: Optional[str],
+    img_status: str,
+    badge_parts: List[str],
+    meta_lines: List[str],
+    web_link: Optional[str],
+    low_priority: bool = False,
+) -> str:
+    """
+    Assemble one result card as a single HTML string.
 
-    # For "unknown" or anything else, do not show a badge
-    return ""
+    The whole card goes out in one st.html call instead of one element
+    per line (no Markdown parsing involved). Title, maker and metadata come
+    from the API and are escaped here, once per card.
+    `img_url` (full size) is only passed when the image probe succeeded.
+    """
+    parts = ['<div class="rijks-card">']
+    if img_url:
+        # Thumbnail sized for the 260px card; off-screen cards load lazily,
+        # and rows below the fold yield bandwidth to the visible ones.
+        priority = ' fetchpriority="low"' if low_priority else ""
+        parts.append(
+            f'<img src="{escape(get_thumbnail_url(img_url))}" alt="" '
+            f'loading="lazy" decoding="async" width="400" height="260"{priority}>'
+        )
+    else:
+        parts.append(image_message_html(img_status))
+    parts.append(f'<div class="rijks-card-title">{escape(title)}</div>')
+    parts.append(f'<div class="rijks-card-caption">{escape(maker)}</div>')
+    if badge_parts:
+        parts.append(f'<div class="rijks-badge-row">{" ".join(badge_parts)}</div>')
+    for line in meta_lines:
+        parts.append(f'<div class="rijks-card-meta">{escape(line)}</div>')
+    if web_link:
+        parts.append(
+            f'<a href="{escape(web_link)}" target="_blank">View on Rijksmuseum website</a>'
+        )
+    parts.append("</div>")
+    return "".join(parts)
 
 
 # ============================================================
 # Session init
 # ============================================================
-load_favorites()
-favorites: Dict[str, Any] = st.session_state.setdefault("favorites", {})
-
-load_notes()
-notes: Dict[str, str] = st.session_state.setdefault("notes", {})
+favorites = get_favorites()
 
-st.session_state.setdefault("results_full", [])
+# Only the fetched count is kept; the filtered list references the dicts it shows
+st.session_state.setdefault("results_fetched_count", 0)
 st.session_state.setdefault("results_filtered", [])
 
 # Ensure there is always a search_meta with at least max_pages=1
 if "search_meta" not in st.session_state:
     st.session_state["search_meta"] = {"max_pages": 1}
 
-track_event_once(
-    event="page_view",
-    page="Explorer",
-    once_key="page_view::Explorer",
-    props={"has_favorites": bool(favorites), "favorites_count": len(favorites)},
-)
+# Checked here so the props are only built on the run that records the event
+if not was_tracked("page_view::Explorer"):
+    track_event_once(
+        event="page_view",
+        page="Explorer",
+        once_key="page_view::Explorer",
+        props={"has_favorites": bool(favorites), "favorites_count": len(favorites)},
+    )
 
 
 # ============================================================
@@ -414,10 +592,7 @@ sidebar = st.sidebar
 sidebar.header("🧭 Explore & Filter")
 
 with sidebar:
-    st.markdown(
-        '<div class="rijks-sidebar-main-title">🏠 Home</div>',
-        unsafe_allow_html=True,
-    )
+    st.html('<div class="rijks-sidebar-main-title">🏠 Home</div>')
 
 sidebar.subheader("Search")
 search_term = sidebar.text_input(
@@ -452,13 +627,15 @@ sort_map = {
 sort_by = sort_map[sort_label]
 
 sidebar.subheader("Fetch limit")
-fetch_limit = sidebar.slider(
-    "Fetch up to",
-    min_value=30,
-    max_value=120,
-    value=30,
-    step=10,
-    help="How many items to fetch from Data Services before local pagination.",
+fetch_limit = int(
+    sidebar.slider(
+        "Fetch up to",
+        min_value=30,
+        max_value=120,
+        value=30,
+        step=10,
+        help="How many items to fetch from Data Services before local pagination.",
+    )
 )
 
 sidebar.subheader("Research scope")
@@ -569,25 +746,29 @@ prev_page = int(st.session_state.get("page_num", 1))
 # Maximum page count known from last search (or 1 if none yet)
 max_pages_known = int(st.session_state.get("search_meta", {}).get("max_pages", 1))
 
-per_page = sidebar.selectbox(
-    "Results per page",
-    options=[12, 24, 30],
-    index=[12, 24, 30].index(prev_per_page)
-    if prev_per_page in [12, 24, 30]
-    else 0,
+per_page = int(
+    sidebar.selectbox(
+        "Results per page",
+        options=[12, 24, 30],
+        index=[12, 24, 30].index(prev_per_page)
+        if prev_per_page in [12, 24, 30]
+        else 0,
+    )
 )
 st.session_state["per_page"] = per_page
 
-page_num = sidebar.number_input(
-    "Page",
-    min_value=1,
-    max_value=max_pages_known,
-    value=min(prev_page, max_pages_known),
-    step=1,
+page_num = int(
+    sidebar.number_input(
+        "Page",
+        min_value=1,
+        max_value=max_pages_known,
+        value=min(prev_page, max_pages_known),
+        step=1,
+    )
 )
-st.session_state["page_num"] = int(page_num)
+st.session_state["page_num"] = page_num
 
-sidebar.markdown("<div style='height: 0.75rem'></div>", unsafe_allow_html=True)
+sidebar.html("<div style='height: 0.75rem'></div>")
 run_search = sidebar.button(
     "🔍 Apply filters & search",
     width="stretch",
@@ -604,15 +785,42 @@ sidebar.caption(
 # ============================================================
 # Main header
 # ============================================================
+HERO_MAX_WIDTH = 1600
+
+
+@st.cache_resource(show_spinner=False)
+def _hero_image_bytes() -> bytes:
+    """
+    Hero image as JPEG bytes, read once per process instead of on every rerun.
+
+    Downscaled to HERO_MAX_WIDTH when Pillow is available (the source file
+    is ~2.4 MB). st.image derives the media URL from the content, so the
+    same bytes keep a stable URL the browser can cache.
+    """
+    raw = HERO_IMAGE_PATH.read_bytes()
+    try:
+        from PIL import Image
+
+        with Image.open(io.BytesIO(raw)) as img:
+            if img.width <= HERO_MAX_WIDTH:
+                return raw
+            img.thumbnail((HERO_MAX_WIDTH, img.height))
+            buf = io.BytesIO()
+            img.convert("RGB").save(buf, format="JPEG", quality=85, optimize=True)
+            return buf.getvalue()
+    except Exception:
+        # Pillow missing or image unreadable: serve the original file
+        return raw
+
+
 st.markdown("### 🎨 Open Collection Research Explorer")
 
 if HERO_IMAGE_PATH.exists():
-    st.markdown('<div class="rijks-hero">', unsafe_allow_html=True)
-    st.image(str(HERO_IMAGE_PATH), width="stretch")
-    st.markdown(
+    st.html('<div class="rijks-hero">')
+    st.image(_hero_image_bytes(), width="stretch")
+    st.html(
         'Photo by <a href="https://unsplash.com/pt-br/@steve_j?utm_source=unsplash&utm_medium=referral&utm_content=creditCopyText">Steve A Johnson</a> on '
-        '<a href="https://unsplash.com/pt-br/fotografias/um-close-up-de-uma-paleta-de-tinta-multicolorida-ZXWOrKZ0h_M?utm_source=unsplash&utm_medium=referral&utm_content=creditCopyText">Unsplash</a>.',
-        unsafe_allow_html=True,
+        '<a href="https://unsplash.com/pt-br/fotografias/um-close-up-de-uma-paleta-de-tinta-multicolorida-ZXWOrKZ0h_M?utm_source=unsplash&utm_medium=referral&utm_content=creditCopyText">Unsplash</a>.'
     )
 st.write(
     "Explore artworks using public collection data made available through Rijksmuseum Data Services / Linked Data. "
@@ -634,68 +842,121 @@ with st.expander("ℹ️ How the search works (quick guide)", expanded=False):
         """
     )
 
+@lru_cache(maxsize=32)
+def _pill_html(count: int) -> str:
+    """Markup of the "Saved artworks" pill for a given count."""
+    return (
+        '<div class="rijks-summary-pill">Saved artworks: '
+        f"<strong>{count}</strong></div>"
+    )
+
+
+# Re-emitted on every rerun: Streamlit drops elements a rerun does not emit.
 saved_pill_placeholder = st.empty()
-saved_pill_placeholder.markdown(
-    f'<div class="rijks-summary-pill">Saved artworks: '
-    f"<strong>{len(favorites)}</strong></div>",
-    unsafe_allow_html=True,
-)
+saved_pill_placeholder.html(_pill_html(len(favorites)))
 
 
 # ============================================================
 # Search execution
 # ============================================================
+@st.cache_data(
+    ttl=900,
+    max_entries=64,
+    show_spinner="Fetching artworks from Rijksmuseum Data Services...",
+)
+def _cached_search(
+    query: str, object_type: str | None, sort_by: str, fetch_limit: int
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Remote search, cached on the remote inputs only.
+
+    Authorship/year/material/place are local post-filters, so re-applying
+    them with the same query does not hit the API again. Results are
+    annotated before they are cached, so the derived fields (year, image URL,
+    lowercased materials/places) are computed once per fetch, not per search.
+    """
+    results, total_found = search_artworks(
+        query=query,
+        page_size=fetch_limit,
+        sort=sort_by,
+        object_type=object_type,
+    )
+    annotate_results(results or [])
+    return results, total_found
+
+
+query = search_term.strip()
+
+# Everything the results on screen depend on: remote inputs + local filters
+search_key = (
+    query,
+    object_type_param,
+    sort_by,
+    fetch_limit,
+    auth_scope,
+    year_min,
+    year_max,
+    material_filter,
+    place_filter,
+)
+
 if run_search:
-    if not search_term.strip():
+    if not query:
         st.warning("Please enter a search term before running the search.")
-        st.session_state["results_full"] = []
+        st.session_state["results_fetched_count"] = 0
         st.session_state["results_filtered"] = []
         st.session_state["search_meta"] = {}
+        st.session_state.pop("_search_key", None)
     else:
         try:
-            with st.spinner("Fetching artworks from Rijksmuseum Data Services..."):
-                raw_results, _total_found = search_artworks(
-                    query=search_term.strip(),
-                    page_size=int(fetch_limit),
-                    sort=sort_by,
-                    object_type=object_type_param,
+            if st.session_state.get("_search_key") == search_key:
+                # Same search and filters as last time: reuse the annotated,
+                # filtered lists already in session instead of re-walking them
+                fetched_count = st.session_state.get("results_fetched_count", 0)
+                filtered = st.session_state.get("results_filtered", [])
+            else:
+                raw_results, _total_found = _cached_search(
+                    query, object_type_param, sort_by, fetch_limit
                 )
-
-            st.session_state["results_full"] = raw_results or []
-
-            filtered = [
-                art
-                for art in (raw_results or [])
-                if passes_authorship_scope(art, auth_scope)
-                and passes_metadata_filters(
-                    art, year_min, year_max, material_filter, place_filter
+                fetched_count = len(raw_results or [])
+                intern_object_numbers(raw_results or [])
+
+                filtered = filter_results(
+                    raw_results or [],
+                    auth_scope,
+                    year_min,
+                    year_max,
+                    material_filter,
+                    place_filter,
                 )
-            ]
+
+            st.session_state["results_fetched_count"] = fetched_count
             st.session_state["results_filtered"] = filtered
+            st.session_state["_search_key"] = search_key
 
             st.session_state["search_meta"] = {
-                "api_count": len(raw_results or []),
+                "api_count": fetched_count,
                 "filtered_count": len(filtered),
-                "fetch_limit": int(fetch_limit),
+                "fetch_limit": fetch_limit,
                 "auth_scope": auth_scope,
-                "per_page": int(per_page),
+                "per_page": per_page,
             }
 
             track_event(
                 event="search_executed",
                 page="Explorer",
                 props={
-                    "query_sample": search_term.strip()[:60],
-                    "query_length": len(search_term.strip()),
+                    "query_sample": query[:60],
+                    "query_length": len(query),
                     "object_type": object_type_param or "Any",
                     "sort_by": sort_by,
-                    "fetch_limit": int(fetch_limit),
+                    "fetch_limit": fetch_limit,
                     "auth_scope": auth_scope,
                     "year_min": year_min,
                     "year_max": year_max,
                     "has_material_filter": bool(material_filter),
                     "has_place_filter": bool(place_filter),
-                    "api_returned": len(raw_results or []),
+                    "api_returned": fetched_count,
                     "filtered_count": len(filtered),
                 },
             )
@@ -704,75 +965,504 @@ if run_search:
             st.error(
                 f"Unexpected error while searching the Rijksmuseum online collection: {e}"
             )
-            st.session_state["results_full"] = []
+            st.session_state["results_fetched_count"] = 0
             st.session_state["results_filtered"] = []
             st.session_state["search_meta"] = {}
+            st.session_state.pop("_search_key", None)
 
 filtered_results: List[Dict[str, Any]] = st.session_state.get(
     "results_filtered", []
 )
 
-total_filtered = len(filtered_results)
-max_pages = max(1, ceil(total_filtered / int(per_page))) if per_page else 1
+meta = st.session_state.get("search_meta", {})
+# Counted once at search time; the list is not modified between searches
+total_filtered = meta.get("filtered_count", len(filtered_results))
+max_pages = max(1, ceil(total_filtered / per_page)) if per_page else 1
 
 # Clamp current page to valid range
-page_num = min(int(page_num), max_pages)
+page_num = min(page_num, max_pages)
 
-# Store updated max_pages back into session
-meta = st.session_state.get("search_meta", {})
-meta["max_pages"] = max_pages
-st.session_state["search_meta"] = meta
-st.session_state["page_num"] = int(page_num)
-
-start_idx = (page_num - 1) * int(per_page)
-end_idx = start_idx + int(per_page)
-page_items = filtered_results[start_idx:end_idx]
+# Store updated max_pages back into session (meta is the session's own dict)
+if meta.get("max_pages") != max_pages:
+    meta["max_pages"] = max_pages
+    st.session_state["search_meta"] = meta
+st.session_state["page_num"] = page_num
 
+start_idx = (page_num - 1) * per_page
+end_idx = start_idx + per_page
 # ---------------------------------------
 # Deduplicate: avoid repeated artworks
 # (also avoids checkbox key conflicts)
+# One dict pass keyed on objectNumber (insertion-ordered); items without an
+# ID are kept as-is after them.
 # ---------------------------------------
-seen_ids = set()
-dedup_items = []
-for art in page_items:
-    obj = art.get("objectNumber")
-    if not obj:
-        # No ID → keep as-is
-        dedup_items.append(art)
-        continue
-    if obj in seen_ids:
-        # Already seen on this page
-        continue
-    seen_ids.add(obj)
-    dedup_items.append(art)
-
-page_items = dedup_items
+# Random-access slice: O(per_page) at any depth (islice would step through
+# every item before start_idx)
+page_window = filtered_results[start_idx:end_idx]
+with_id: Dict[str, Dict[str, Any]] = {}
+no_id: List[Dict[str, Any]] = []
+for a in page_window:
+    obj_num = a.get("objectNumber")
+    if obj_num:
+        # First occurrence wins (a comprehension would keep the last one)
+        with_id.setdefault(obj_num, a)
+    else:
+        no_id.append(a)
+page_items = list(with_id.values()) + no_id
+
+# Last-rendered checkbox values (see render_card): only this page's cards
+# matter, so the map never outgrows one page
+fav_rendered = st.session_state.get("fav_rendered")
+if fav_rendered:
+    st.session_state["fav_rendered"] = {
+        obj_num: fav_rendered[obj_num]
+        for obj_num in with_id
+        if obj_num in fav_rendered
+    }
 # ---------------------------------------
 
-if total_filtered > 0:
-    st.caption(
-        f"Showing page **{page_num} / {max_pages}** — "
-        f"**{len(page_items)}** item(s) on this page — "
-        f"**{total_filtered}** item(s) after filters "
-        f"(fetched: {len(st.session_state.get('results_full', []))})."
+@st.cache_data(show_spinner=False)
+def _fetch_better_title(object_number: str) -> str | None:
+    """
+    When the search result only shows the objectNumber as title (or nothing),
+    try to fetch a better title from the Linked Art metadata.
+
+    Cached to avoid repeated requests while browsing.
+    """
+    if not object_number:
+        return None
+
+    try:
+        detail = fetch_metadata_by_objectnumber(object_number)
+    except Exception:  # includes RijksAPIError
+        return None
+
+    return _title_from_detail(detail)
+
+
+def _lookup_better_title(object_number: str) -> str | None:
+    """
+    Uncached `_fetch_better_title` for the prefetch pool's threads: plain
+    HTTP, no st.cache_data call outside the script thread.
+    """
+    try:
+        detail = load_metadata_by_objectnumber(object_number)
+    except Exception:  # includes RijksAPIError
+        return None
+
+    return _title_from_detail(detail)
+
+
+def _title_from_detail(detail: Any) -> str | None:
+    """Best title in a Linked Art metadata record (None when there is none)."""
+    if not isinstance(detail, dict):
+        return None
+
+    art_obj = detail.get("artObject") or detail
+
+    # Try these keys in order of preference
+    for key in ("titleEnglish", "title", "longTitle"):
+        val = (art_obj.get(key) or "").strip()
+        if val:
+            return val
+
+    return None
+
+
+def _base_title(art: Dict[str, Any]) -> str:
+    """
+    Title as shipped in the search result (before any detail lookup).
+
+    A title that is just the objectNumber falls back to longTitle, so only
+    artworks with neither trigger a Linked Art lookup.
+    """
+    obj_num_str = (art.get("objectNumber") or "").strip()
+    raw_title = (art.get("title") or "").strip()
+    if raw_title and raw_title != obj_num_str:
+        return raw_title
+    return (art.get("longTitle") or "").strip() or raw_title or "Untitled"
+
+
+def _title_lookup_id(art: Dict[str, Any], title: str) -> Optional[str]:
+    """objectNumber to look up when `title` is empty or just the objectNumber."""
+    obj_num_str = (art.get("objectNumber") or "").strip()
+    if obj_num_str and title in (obj_num_str, "Untitled"):
+        return obj_num_str
+    return None
+
+
+TITLE_PREFETCH_WORKERS = 4
+
+
+@st.cache_resource(show_spinner=False)
+def _title_prefetch_pool() -> ThreadPoolExecutor:
+    """Process-wide pool for the background title lookups of the next page."""
+    return ThreadPoolExecutor(
+        max_workers=TITLE_PREFETCH_WORKERS, thread_name_prefix="title-prefetch"
     )
-else:
-    if st.session_state.get("results_full"):
-        st.warning(
-            "Results were fetched, but none match your current filters. "
-            "Try broadening scope and/or filters."
-        )
+
+
+def _prefetch_titles(items: List[Dict[str, Any]]) -> None:
+    """
+    Submit title lookups for `items` without waiting for them.
+
+    The futures are kept in session state (for the next page only), and the
+    results are picked up on the script thread by `_prefetched_titles` when
+    the user moves to that page.
+    """
+    pending = st.session_state.get("_title_prefetch", {})
+    pool = _title_prefetch_pool()
+    futures = {}
+    for art in items:
+        lookup_id = _title_lookup_id(art, _base_title(art))
+        if lookup_id and lookup_id not in futures:
+            futures[lookup_id] = pending.get(lookup_id) or pool.submit(
+                _lookup_better_title, lookup_id
+            )
+    st.session_state["_title_prefetch"] = futures
+
+
+def _prefetched_titles() -> Dict[str, Optional[str]]:
+    """Titles whose background lookup has finished (see `_prefetch_titles`)."""
+    pending = st.session_state.get("_title_prefetch", {})
+    return {i: fut.result() for i, fut in pending.items() if fut.done()}
+
+
+PROBE_WORKERS = 16
+
+# Maker placeholders (lowercased) shown as "Unknown artist" / "anonymous"
+UNKNOWN_MAKERS = frozenset(
+    {
+        "",
+        "unknown",
+        "unknown artist",
+        "onbekend",
+        "onbekende kunstenaar",
+        "n/a",
+        "niet vermeld",
+    }
+)
+ANON_MAKERS = frozenset({"anonymous", "anoniem"})
+
+# Grid rows treated as above the fold (their images keep default fetch priority)
+EAGER_ROWS = 2
+
+
+def _fetch_page_io(
+    urls: List[Optional[str]], title_ids: List[str]
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Optional[str]]]:
+    """
+    Probe the page's image URLs and look up its missing titles concurrently
+    (both are I/O-bound), sharing one thread pool.
+
+    Duplicates are requested once; `probe_image_url` and `_fetch_better_title`
+    are themselves cached, so reruns only hit the network for new keys.
+    """
+    unique_urls = list(dict.fromkeys(u for u in urls if u))
+    unique_ids = list(dict.fromkeys(title_ids))
+    total = len(unique_urls) + len(unique_ids)
+    if not total:
+        return {}, {}
+    with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, total)) as ex:
+        probe_futs = [ex.submit(probe_image_url, u) for u in unique_urls]
+        title_futs = [ex.submit(_fetch_better_title, i) for i in unique_ids]
+        probes = {u: f.result() for u, f in zip(unique_urls, probe_futs)}
+        titles = {i: f.result() for i, f in zip(unique_ids, title_futs)}
+    return probes, titles
+
+
+# ============================================================
+# Results grid (cards)
+# ============================================================
+@st.fragment
+def render_card(
+    art: Dict[str, Any],
+    img_url: Optional[str],
+    title_base: str,
+    better_title: Optional[str],
+    probe: Optional[Dict[str, Any]],
+    has_notes: bool,
+    low_priority: bool,
+) -> None:
+    """
+    Render one result card and its selection checkbox.
+
+    Runs as a fragment: toggling the checkbox reruns only this card, not the
+    search / filter / dedup pipeline or the other cards. The page-level I/O
+    (image probe, title lookup) is done by the grid and passed in.
+    Bulk actions and sidebar changes still trigger a full rerun.
+    """
+    favorites = st.session_state["favorites"]
+    object_number = art.get("objectNumber")
+
+    # ---------------------------------------
+    # 1) Title (with detail-API fallback)
+    # ---------------------------------------
+    display_title = title_base
+
+    # If the "title" is just the objectNumber or empty, use the
+    # more descriptive Linked Art title looked up by the grid.
+    lookup_id = _title_lookup_id(art, display_title)
+    if lookup_id and better_title and better_title != lookup_id:
+        display_title = better_title
+
+    # ---------------------------------------
+    # 2) Artist (normalized)
+    # ---------------------------------------
+    raw_maker = art.get("principalOrFirstMaker", "")
+    maker_norm = (raw_maker or "").strip()
+    maker_l = maker_norm.lower()
+
+    if maker_l in UNKNOWN_MAKERS:
+        maker = "Unknown artist"
+    elif maker_l in ANON_MAKERS:
+        maker = "anonymous"
     else:
-        st.info(
-            "No artworks to display yet. Use the sidebar and click "
-            "**Apply filters & search**."
+        maker = maker_norm
+
+    web_link = (art.get("links") or {}).get("web")
+
+    # ---------------------------------------
+    # 3) Image + status
+    # ---------------------------------------
+    status = (art.get("_image_status") or "no_public_image").lower()
+    img_status = "no_public_image"
+
+    if img_url and probe is not None:
+        if probe.get("ok"):
+            img_status = "ok"
+        else:
+            pstatus = (probe.get("status") or "").lower()
+            if pstatus == "copyright":
+                status = "copyright"
+            else:
+                status = "broken"
+
+    # ---------------------------------------
+    # 4) Selection state
+    #    (the checkbox itself is rendered below the card HTML;
+    #    its state is widget-managed, initialized from favorites)
+    # ---------------------------------------
+    checkbox_key = f"fav_{object_number}" if object_number else None
+    was_fav = object_number in favorites
+    if checkbox_key:
+        # No entry yet before the widget's first render: fall back to favorites
+        is_fav = bool(st.session_state.get(checkbox_key, was_fav))
+    else:
+        is_fav = False
+
+    # ---------------------------------------
+    # 5) Badges
+    # ---------------------------------------
+    badge_parts: List[str] = list(_STATE_BADGES_HTML[is_fav, has_notes])
+
+    # Authorship scope (direct / attributed / etc.)
+    badge_parts.append(attribution_badge_html(art))
+
+    # Work kind: original / reproduction / photograph
+    work_kind = art.get("_work_kind")
+    if isinstance(work_kind, str) and work_kind:
+        wk_badge = work_kind_badge_html(work_kind)
+        if wk_badge:
+            badge_parts.append(wk_badge)
+
+    # Special image status (copyright, page missing, etc.)
+    if img_status != "ok":
+        extra = image_status_badge_html(status)
+        if extra:
+            badge_parts.append(extra)
+
+    # ---------------------------------------
+    # 6) Basic metadata
+    # ---------------------------------------
+    dating = art.get("dating") or {}
+    presenting_date = dating.get("presentingDate")
+    year = art.get("_year")
+
+    meta_lines: List[str] = []
+    if presenting_date:
+        meta_lines.append(f"Date: {presenting_date}")
+    elif year:
+        meta_lines.append(f"Year: {year}")
+
+    if object_number:
+        meta_lines.append(f"Object ID: {object_number}")
+
+    # ---------------------------------------
+    # 7) Card (single HTML emit)
+    # ---------------------------------------
+    st.html(
+        render_card_html(
+            title=display_title,
+            maker=maker,
+            img_url=img_url if img_status == "ok" else None,
+            img_status=status,
+            badge_parts=badge_parts,
+            meta_lines=meta_lines,
+            web_link=web_link,
+            low_priority=low_priority,
         )
+    )
+
+    # ---------------------------------------
+    # 8) Checkbox "In my selection"
+    # ---------------------------------------
+    if checkbox_key:
+        # Value this checkbox had when the card was last rendered: only a
+        # change against it is a user toggle. A widget state that merely
+        # disagrees with favorites (changed behind its back) is not, and must
+        # not log events or journal a second time.
+        rendered = st.session_state.setdefault("fav_rendered", {})
+        prev_checked = rendered.get(object_number, was_fav)
+        checked = st.checkbox(
+            "In my selection",
+            value=was_fav,
+            key=checkbox_key,
+        )
+        rendered[object_number] = checked
+
+        if checked != was_fav and checked != prev_checked:
+            if checked:
+                favorites[object_number] = favorite_entry(art)
+                # Both events in one analytics write
+                track_events(
+                    [
+                        (
+                            "selection_add_item",
+                            "Explorer",
+                            {
+                                "object_id": object_number,
+                                "artist": maker,
+                                "source": "Explorer",
+                            },
+                        ),
+                        (
+                            "artwork_view",
+                            "Explorer",
+                            {
+                                "object_id": object_number,
+                                "artist": maker,
+                                "source": "selection_checkbox",
+                            },
+                        ),
+                    ]
+                )
+            else:
+                favorites.pop(object_number, None)
+                track_event(
+                    event="selection_remove_item",
+                    page="Explorer",
+                    props={
+                        "object_id": object_number,
+                        "artist": maker,
+                        "source": "Explorer",
+                    },
+                )
+
+            st.session_state["favorites"] = favorites
+            # One journal line per toggle; full rewrite only to compact
+            if append_favorite_op(
+                "add" if checked else "del",
+                object_number,
+                favorites[object_number] if checked else None,
+            ):
+                mark_favorites_dirty()
+            saved_pill_placeholder.html(_pill_html(len(favorites)))
+
+    # A checkbox toggle reruns only this fragment, so flush here as well
+    flush_favorites()
+
+
+def render_results_grid(page_items: List[Dict[str, Any]]) -> None:
+    """
+    Render the card grid for the current page.
+
+    The image probes and title lookups for the whole page run concurrently
+    up front; each card is then its own fragment (see `render_card`).
+    """
+    # Notes are only needed for the card badges
+    noted_ids = get_noted_ids()
+    cards_per_row = 3
+    page_img_urls = [art.get("_img_url") for art in page_items]
+    page_titles_base = [_base_title(art) for art in page_items]
+    page_lookup_ids = [
+        _title_lookup_id(art, title) for art, title in zip(page_items, page_titles_base)
+    ]
+    # Titles prefetched in the background for this page are used as they are;
+    # only the rest is looked up in the page's I/O batch
+    ready_titles = _prefetched_titles()
+    page_probes, page_better_titles = _fetch_page_io(
+        page_img_urls, [i for i in page_lookup_ids if i and i not in ready_titles]
+    )
+    page_better_titles.update(ready_titles)
+
+    # Row widths up front; each row then draws its cards from one shared
+    # iterator (zip pulls from `cols` first, so no card is skipped)
+    full_rows, remainder = divmod(len(page_items), cards_per_row)
+    row_widths = [cards_per_row] * full_rows + ([remainder] if remainder else [])
+    eager_cards = cards_per_row * EAGER_ROWS
+    cards = enumerate(zip(page_items, page_img_urls, page_titles_base, page_lookup_ids))
+
+    for width in row_widths:
+        for col, (idx, (art, img_url, title_base, lookup_id)) in zip(
+            st.columns(width), cards
+        ):
+            with col:
+                render_card(
+                    art,
+                    img_url,
+                    title_base,
+                    page_better_titles.get(lookup_id) if lookup_id else None,
+                    page_probes.get(img_url) if img_url else None,
+                    art.get("objectNumber") in noted_ids,
+                    low_priority=idx >= eager_cards,
+                )
+
+# Cards rendered per "Load more" step (the smallest page size)
+GRID_BATCH = 12
+
+
+def show_more_cards(grid_token: Tuple[Any, ...], visible: int) -> None:
+    """Button callback: reveal more cards of the current page."""
+    st.session_state["explorer_visible"] = (grid_token, visible)
+
+
+def reset_fav_checkboxes(object_numbers: Iterable[str], selected: bool) -> None:
+    """
+    Drop the `fav_<id>` checkbox states that disagree with `selected`.
+
+    The checkboxes are widget-managed (initialized from favorites via
+    `value=`), so instead of writing their keys through the Session State API
+    (which keeps them alive after the widgets are gone), a bulk action clears
+    the stale ones and they re-initialize from favorites on the next run.
+    """
+    # One proxy lookup per checkbox (absent keys read as None), then the
+    # stale ones are dropped together
+    state = st.session_state
+    stale: List[str] = []
+    for obj_num in object_numbers:
+        key = f"fav_{obj_num}"
+        value = state.get(key)
+        if value is not None and bool(value) != selected:
+            stale.append(key)
+    for key in stale:
+        del state[key]
 
 
 # ============================================================
-# Bulk selection tools
+# Page output: caption, bulk tools and grid
 # ============================================================
+# Everything below the caption needs at least one card; the empty case only
+# shows a hint.
 if page_items:
+    st.caption(
+        f"Showing page **{page_num} / {max_pages}** — "
+        f"**{len(page_items)}** item(s) on this page — "
+        f"**{total_filtered}** item(s) after filters "
+        f"(fetched: {st.session_state.get('results_fetched_count', 0)})."
+    )
+
+    # Bulk selection tools
     st.markdown("### Selection tools (current page)")
     col_add, col_remove = st.columns(2)
 
@@ -790,288 +1480,121 @@ if page_items:
         )
 
     # ADD ALL: force all artworks on this page into the selection
+    # The page's artworks with an ID, objectNumber -> art: the dedup dict
+    # built above, so the bulk actions do not rescan page_items
+    page_by_id = with_id
+
     if add_all_clicked:
-        for art in page_items:
-            obj_num = art.get("objectNumber")
-            if not obj_num:
-                continue
+        # Only artworks not yet selected need a write (dict keys are the index)
+        page_favs = {
+            obj_num: favorite_entry(art)
+            for obj_num, art in page_by_id.items()
+            if obj_num not in favorites
+        }
+        favorites.update(page_favs)
+        # Unchecked boxes on this page re-initialize (checked) from favorites
+        reset_fav_checkboxes(page_by_id, selected=True)
 
-            # Ensure it is in favorites
-            favorites[obj_num] = art
-            # Force the corresponding checkbox to be checked
-            st.session_state[f"fav_{obj_num}"] = True
+        if page_favs:
+            # One event for the whole page (not one per artwork)
+            track_event(
+                event="selection_bulk_add",
+                page="Explorer",
+                props={
+                    "object_ids": list(page_favs),
+                    "count": len(page_favs),
+                    "source": "Explorer",
+                },
+            )
 
         st.session_state["favorites"] = favorites
-        save_favorites()
-        saved_pill_placeholder.markdown(
-            f'<div class="rijks-summary-pill">Saved artworks: '
-            f"<strong>{len(favorites)}</strong></div>",
-            unsafe_allow_html=True,
+        # Journal only this page's new artworks; full rewrite only to compact
+        if append_favorite_ops(
+            ("add", obj_num, art) for obj_num, art in page_favs.items()
+        ):
+            mark_favorites_dirty()
+        # Count unchanged (all already selected): keep the pill as it is
+        if page_favs:
+            saved_pill_placeholder.html(_pill_html(len(favorites)))
+        # Every card on the page changed: rerun the whole app, not a fragment.
+        # The rerun drops anything shown in this run, so the confirmation is
+        # kept in session state and shown once by the next run.
+        st.session_state["bulk_message"] = (
+            "All artworks on this page were added to your selection."
         )
-        st.success("All artworks on this page were added to your selection.")
-        st.rerun()
+        st.rerun(scope="app")
 
     # REMOVE ALL: remove all artworks on this page from the selection
     if remove_all_clicked:
-        for art in page_items:
-            obj_num = art.get("objectNumber")
-            if not obj_num:
-                continue
+        # Only artworks actually selected need a write
+        removed_ids = [obj_num for obj_num in page_by_id if obj_num in favorites]
+        for obj_num in removed_ids:
+            del favorites[obj_num]
+        reset_fav_checkboxes(page_by_id, selected=False)
 
-            favorites.pop(obj_num, None)
-            st.session_state[f"fav_{obj_num}"] = False
+        if removed_ids:
+            track_event(
+                event="selection_bulk_remove",
+                page="Explorer",
+                props={
+                    "object_ids": removed_ids,
+                    "count": len(removed_ids),
+                    "source": "Explorer",
+                },
+            )
 
         st.session_state["favorites"] = favorites
-        save_favorites()
-        saved_pill_placeholder.markdown(
-            f'<div class="rijks-summary-pill">Saved artworks: '
-            f"<strong>{len(favorites)}</strong></div>",
-            unsafe_allow_html=True,
+        if append_favorite_ops(("del", obj_num, None) for obj_num in removed_ids):
+            mark_favorites_dirty()
+        if removed_ids:
+            saved_pill_placeholder.html(_pill_html(len(favorites)))
+        st.session_state["bulk_message"] = (
+            "All artworks on this page were removed from your selection."
         )
-        st.success("All artworks on this page were removed from your selection.")
-        st.rerun()
-
-
-@st.cache_data(show_spinner=False)
-def _fetch_better_title(object_number: str) -> str | None:
-    """
-    When the search result only shows the objectNumber as title (or nothing),
-    try to fetch a better title from the Linked Art metadata.
-
-    Cached to avoid repeated requests while browsing.
-    """
-    if not object_number:
-        return None
-
-    try:
-        detail = fetch_metadata_by_objectnumber(object_number)
-    except (RijksAPIError, Exception):
-        return None
-
-    if not isinstance(detail, dict):
-        return None
-
-    art_obj = detail.get("artObject") or detail
-
-    # Try these keys in order of preference
-    for key in ("titleEnglish", "title", "longTitle"):
-        val = (art_obj.get(key) or "").strip()
-        if val:
-            return val
-
-    return None
-
+        st.rerun(scope="app")
+
+    # Confirmation of the bulk action that triggered this run (shown once)
+    bulk_message = st.session_state.pop("bulk_message", None)
+    if bulk_message:
+        st.success(bulk_message)
+
+    # Results grid (cards): the first GRID_BATCH cards, more on request.
+    # Hidden cards cost nothing (no probe, no title lookup, no image).
+    grid_token = (st.session_state.get("_search_key"), page_num, per_page)
+    visible_state = st.session_state.get("explorer_visible")
+    if not visible_state or visible_state[0] != grid_token:
+        visible_state = (grid_token, GRID_BATCH)
+        st.session_state["explorer_visible"] = visible_state
+    visible = visible_state[1]
+
+    render_results_grid(page_items[:visible])
+
+    hidden = len(page_items) - visible
+    if hidden > 0:
+        st.button(
+            f"Load {min(hidden, GRID_BATCH)} more",
+            key="btn_load_more",
+            on_click=show_more_cards,
+            args=(grid_token, visible + GRID_BATCH),
+        )
+elif st.session_state.get("results_fetched_count"):
+    st.warning(
+        "Results were fetched, but none match your current filters. "
+        "Try broadening scope and/or filters."
+    )
+else:
+    st.info(
+        "No artworks to display yet. Use the sidebar and click "
+        "**Apply filters & search**."
+    )
 
-# ============================================================
-# Results grid (cards)
-# ============================================================
-if page_items:
-    cards_per_row = 3
-    for start in range(0, len(page_items), cards_per_row):
-        row = page_items[start : start + cards_per_row]
-        cols = st.columns(len(row))
 
-        for col, art in zip(cols, row):
-            with col:
-                st.markdown('<div class="rijks-card">', unsafe_allow_html=True)
-
-                object_number = art.get("objectNumber")
-
-                # ---------------------------------------
-                # 1) Title (with detail-API fallback)
-                # ---------------------------------------
-                raw_title = (art.get("title") or "").strip()
-                long_title = (art.get("longTitle") or "").strip()
-                obj_num_str = (object_number or "").strip()
-
-                display_title = raw_title or long_title or "Untitled"
-
-                # If the "title" is just the objectNumber or empty,
-                # try to fetch something more descriptive via Linked Art metadata.
-                if obj_num_str and (
-                    display_title == obj_num_str or display_title == "Untitled"
-                ):
-                    better = _fetch_better_title(obj_num_str)
-                    if better and better != obj_num_str:
-                        display_title = better
-
-                # ---------------------------------------
-                # 2) Artist (normalized)
-                # ---------------------------------------
-                raw_maker = art.get("principalOrFirstMaker", "")
-                maker_norm = (raw_maker or "").strip()
-
-                if maker_norm.lower() in (
-                    "",
-                    "unknown",
-                    "unknown artist",
-                    "onbekend",
-                    "onbekende kunstenaar",
-                    "n/a",
-                    "niet vermeld",
-                ):
-                    maker = "Unknown artist"
-                elif maker_norm.lower() in ("anonymous", "anoniem"):
-                    maker = "anonymous"
-                else:
-                    maker = maker_norm
-
-                web_link = (art.get("links") or {}).get("web")
-
-                note_text = notes.get(object_number, "") if object_number else ""
-                has_notes = isinstance(note_text, str) and note_text.strip() != ""
-
-                # ---------------------------------------
-                # 3) Image + status
-                # ---------------------------------------
-                img_url = get_best_image_url(art)
-                status = (art.get("_image_status") or "no_public_image").lower()
-                img_status = "no_public_image"
-
-                if img_url:
-                    probe = probe_image_url(img_url)
-                    if probe.get("ok"):
-                        img_status = "ok"
-                        st.image(img_url, width="stretch")
-                    else:
-                        pstatus = (probe.get("status") or "").lower()
-                        if pstatus == "copyright":
-                            status = "copyright"
-                        else:
-                            status = "broken"
-
-                if img_status != "ok":
-                    render_image_message(status)
-
-                # ---------------------------------------
-                # 4) Title + artist in the card
-                # ---------------------------------------
-                st.markdown(
-                    f'<div class="rijks-card-title">{display_title}</div>',
-                    unsafe_allow_html=True,
-                )
-                st.markdown(
-                    f'<div class="rijks-card-caption">{maker}</div>',
-                    unsafe_allow_html=True,
-                )
+# Warm the title lookups of the next page while the user reads this one
+_prefetch_titles(filtered_results[end_idx : end_idx + per_page])
 
-                # ---------------------------------------
-                # 5) Checkbox "In my selection"
-                #    (controlled only via session_state)
-                # ---------------------------------------
-                if object_number:
-                    checkbox_key = f"fav_{object_number}"
-
-                    # Initialize checkbox state only once
-                    if checkbox_key not in st.session_state:
-                        st.session_state[checkbox_key] = object_number in favorites
-
-                    checked = st.checkbox(
-                        "In my selection",
-                        key=checkbox_key,
-                    )
-
-                    was_fav = object_number in favorites
-
-                    if checked != was_fav:
-                        if checked:
-                            favorites[object_number] = art
-                            track_event(
-                                event="selection_add_item",
-                                page="Explorer",
-                                props={
-                                    "object_id": object_number,
-                                    "artist": maker,
-                                    "source": "Explorer",
-                                },
-                            )
-                            track_event(
-                                event="artwork_view",
-                                page="Explorer",
-                                props={
-                                    "object_id": object_number,
-                                    "artist": maker,
-                                    "source": "selection_checkbox",
-                                },
-                            )
-                        else:
-                            favorites.pop(object_number, None)
-                            track_event(
-                                event="selection_remove_item",
-                                page="Explorer",
-                                props={
-                                    "object_id": object_number,
-                                    "artist": maker,
-                                    "source": "Explorer",
-                                },
-                            )
-
-                        st.session_state["favorites"] = favorites
-                        save_favorites()
-                        saved_pill_placeholder.markdown(
-                            f'<div class="rijks-summary-pill">Saved artworks: '
-                            f"<strong>{len(favorites)}</strong></div>",
-                            unsafe_allow_html=True,
-                        )
-
-                    is_fav = checked
-                else:
-                    is_fav = False
-
-                # ---------------------------------------
-                # 6) Badges
-                # ---------------------------------------
-                badge_parts: List[str] = []
-
-                if is_fav:
-                    badge_parts.append(
-                        '<span class="rijks-badge rijks-badge-primary">⭐ In my selection</span>'
-                    )
-                if has_notes:
-                    badge_parts.append(
-                        '<span class="rijks-badge rijks-badge-secondary">📝 Notes</span>'
-                    )
-
-                # Authorship scope (direct / attributed / etc.)
-                badge_parts.append(attribution_badge_html(art))
-
-                # Work kind: original / reproduction / photograph
-                work_kind = art.get("_work_kind")
-                if isinstance(work_kind, str) and work_kind:
-                    wk_badge = work_kind_badge_html(work_kind)
-                    if wk_badge:
-                        badge_parts.append(wk_badge)
-
-                # Special image status (copyright, page missing, etc.)
-                if img_status != "ok":
-                    extra = image_status_badge_html(status)
-                    if extra:
-                        badge_parts.append(extra)
-
-                if badge_parts:
-                    st.markdown(
-                        '<div class="rijks-badge-row">' + " ".join(badge_parts) + "</div>",
-                        unsafe_allow_html=True,
-                    )
-                # ---------------------------------------
-                # 7) Basic metadata
-                # ---------------------------------------
-                dating = art.get("dating") or {}
-                presenting_date = dating.get("presentingDate")
-                year = extract_year(dating) if dating else None
-
-                if presenting_date:
-                    st.text(f"Date: {presenting_date}")
-                elif year:
-                    st.text(f"Year: {year}")
-
-                if object_number:
-                    st.text(f"Object ID: {object_number}")
-
-                if web_link:
-                    st.markdown(f"[View on Rijksmuseum website]({web_link})")
-
-                st.markdown("</div>", unsafe_allow_html=True)
+# Deferred snapshot write (at most one per run; bulk actions rerun before
+# reaching this point, so their request is flushed by the next run)
+flush_favorites()
 
 
 # ============================================================